@@ -55,6 +55,12 @@ def get_service_registry(request: Request) -> ServiceRegistry:
     return registry
 
 
+def get_optional_service_registry(request: Request) -> ServiceRegistry | None:
+    """Return the service registry, or ``None`` before the app has initialised it."""
+
+    return getattr(request.app.state, "services", None)
+
+
 def get_state_manager(registry: ServiceRegistry = Depends(get_service_registry)) -> StateManager:
     return registry.state_manager
 
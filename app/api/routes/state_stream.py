@@ -2,13 +2,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 
 from app.api.dependencies import get_state_manager, get_state_stream_service
+from app.core import json_codec
 from app.core.exceptions import ServiceUnavailableError
 from app.services.state_manager import StateManager
 from app.services.state_stream_service import StateStreamService
@@ -24,7 +24,7 @@ class SafeStreamingResponse(StreamingResponse):
 
 
 def _sse_event(event: str, data: dict, event_id: Optional[int] = None) -> str:
-    payload = json.dumps(data, separators=(",", ":"))
+    payload = json_codec.dumps(data).decode("utf-8")
     parts = []
     if event_id is not None:
         parts.append(f"id: {event_id}")
@@ -3,6 +3,7 @@ import json
 import os
 import secrets
 import tempfile
+import time
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
@@ -15,6 +16,7 @@ DEFAULT_MQTT_PORT = 8883
 DEFAULT_FTP_PORT = 990
 DEFAULT_CAM_PORT = 6000
 DEFAULT_CAM_DEVICE_ID = "bblp"
+PRINTER_DEFINITIONS_TTL = 2.0
 
 
 class PrinterConfig(BaseModel):
@@ -197,6 +199,7 @@ def _write_config_to_json(config: ConfigFile) -> None:
 
     config_path = _ensure_config_file()
     _persist_config(config, config_path)
+    _invalidate_printer_definitions_cache()
 
 
 async def _load_config_from_json_async() -> ConfigFile:
@@ -250,11 +253,30 @@ def has_printers() -> bool:
     return bool(config.printers)
 
 
+_printer_definitions_cache: tuple[float, list[PrinterConfig]] | None = None
+
+
+def _invalidate_printer_definitions_cache() -> None:
+    global _printer_definitions_cache
+    _printer_definitions_cache = None
+
+
 async def list_printer_definitions_async() -> list[PrinterConfig]:
-    """Async helper returning all printer definitions."""
+    """Async helper returning all printer definitions.
+
+    Results are memoized for ``PRINTER_DEFINITIONS_TTL`` seconds so a single
+    endpoint call does not re-read app.json; any config write invalidates it.
+    """
+
+    global _printer_definitions_cache
+    cached = _printer_definitions_cache
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < PRINTER_DEFINITIONS_TTL:
+        return list(cached[1])
 
     config = await _load_config_from_json_async()
-    return config.printers
+    _printer_definitions_cache = (now, config.printers)
+    return list(config.printers)
 
 
 def set_default_printer(printer_id: str) -> ConfigFile:
@@ -1,6 +1,7 @@
 """Domain models representing the printer state."""
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Literal
 from uuid import uuid4
 
@@ -330,6 +331,7 @@ STAGE_DESCRIPTIONS: dict[int, str] = {
 }
 
 
+@lru_cache(maxsize=256)
 def resolve_stage_label(code: int | str | None) -> str:
     if code is None:
         return "-"
@@ -347,6 +349,11 @@ def resolve_ams_status(value: int | None) -> tuple[str, str, int | None, int | N
         raw = int(value)
     except (TypeError, ValueError):
         return AmsStatusMain.UNKNOWN.name, AmsSubStatus.UNKNOWN.name, None, None
+    return _decode_ams_status(raw)
+
+
+@lru_cache(maxsize=256)
+def _decode_ams_status(raw: int) -> tuple[str, str, int, int]:
     main_int = (raw & 0xFF00) >> 8
     sub_int = raw & 0xFF
     try:
@@ -1,6 +1,7 @@
 """Static registry describing printer and AMS feature flags."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Mapping
 
 from app.models import AmsUnitCapabilities, PrinterCapabilities
@@ -33,8 +34,12 @@ AMS_FIELD_OVERRIDES: Mapping[str, dict[str, Any]] = {
 }
 
 
+@lru_cache(maxsize=32)
 def resolve_printer_capabilities(model_name: str | None) -> PrinterCapabilities:
-    """Return capability flags for the provided printer model."""
+    """Return capability flags for the provided printer model.
+
+    Results are cached and shared; callers must not mutate them.
+    """
 
     normalized = _normalize(model_name)
     overrides = PRINTER_FIELD_OVERRIDES.get(normalized)
@@ -44,8 +49,12 @@ def resolve_printer_capabilities(model_name: str | None) -> PrinterCapabilities:
     )
 
 
+@lru_cache(maxsize=32)
 def resolve_ams_capabilities(product_name: str | None) -> AmsUnitCapabilities:
-    """Return capability flags for a given AMS product."""
+    """Return capability flags for a given AMS product.
+
+    Results are cached and shared; callers must not mutate them.
+    """
 
     normalized = _normalize(product_name)
     overrides = AMS_FIELD_OVERRIDES.get(normalized)
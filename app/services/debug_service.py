@@ -23,7 +23,7 @@ class DebugService:
 
         async with self._lock:
             try:
-                payload = json.loads(raw_payload.decode("utf-8"))
+                payload = json.loads(raw_payload)
             except (json.JSONDecodeError, UnicodeDecodeError) as exc:
                 logger.error("Failed to decode MQTT payload: %s", exc)
                 # Store an entry even when decode fails.
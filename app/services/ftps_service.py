@@ -35,6 +35,10 @@ from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+_DOS_LIST_LINE_RE = re.compile(
+	r"^(\d{2})-(\d{2})-(\d{2})\s+(\d{2}:\d{2})(AM|PM)\s+(<DIR>|\d+)\s+(.+)$"
+)
+
 
 class FTPSService:
 	def __init__(self, settings: Settings):
@@ -437,10 +441,7 @@ class FTPSService:
 		if not line:
 			return None
 
-		dos_match = re.match(
-			r"^(\d{2})-(\d{2})-(\d{2})\s+(\d{2}:\d{2})(AM|PM)\s+(<DIR>|\d+)\s+(.+)$",
-			line,
-		)
+		dos_match = _DOS_LIST_LINE_RE.match(line)
 		if dos_match:
 			month, day, year_suffix, time_part, ampm, size_or_dir, name = dos_match.groups()
 			is_dir = size_or_dir == "<DIR>"
@@ -556,14 +557,19 @@ class FTPSService:
 				entries,
 				key=lambda item: (not item["is_directory"], item["name"].lower()),
 			)
+			file_count = 0
+			directory_count = 0
+			for e in files_sorted:
+				if not e["is_directory"]:
+					file_count += 1
+				elif e["name"] != "..":
+					directory_count += 1
 			return {
 				"files": files_sorted,
 				"current_path": normalized_path,
 				"is_connected": True,
-				"file_count": len([e for e in files_sorted if not e.get("is_directory")]),
-				"directory_count": len(
-					[e for e in files_sorted if e.get("is_directory") and e["name"] != ".."]
-				),
+				"file_count": file_count,
+				"directory_count": directory_count,
 				"is_fallback": False,
 			}
 		except FTPError as exc:
@@ -854,7 +860,6 @@ class FTPSService:
 					username=self._settings.printer_username,
 					password=self._settings.access_code,
 					remote_path=full_remote,
-					chunk_size=self._client.chunk_size if self._client else 64 * 1024,
 					progress=_progress,
 					timeout=self._client.timeout if self._client else 30.0,
 					cancel_event=self._upload_cancel_event,
@@ -17,6 +17,7 @@ from typing import Optional
 
 from aiomqtt import Client, MqttError
 
+from app.core import json_codec
 from app.core.config import Settings
 from app.core.tasks import monitor_task
 from app.core.request_context import request_context
@@ -26,6 +27,8 @@ from app.services.utils.backoff import Backoff
 
 logger = logging.getLogger(__name__)
 
+_HEARTBEAT_PAYLOAD = json_codec.dumps({"print": {"command": "heartbeat"}})
+
 
 class MQTTService:
 	"""Maintain the MQTT connection and forward events to the state manager."""
@@ -46,6 +49,7 @@ class MQTTService:
 		self._printer_id = settings.printer_id
 		self._reconnect_backoff = Backoff(base_delay=5.0, max_delay=60.0)
 		self._last_message_at: float = 0.0
+		self._request_topic = f"device/{settings.serial}/request"
 
 	async def start(self) -> None:
 		if self._is_running:
@@ -151,10 +155,7 @@ class MQTTService:
 		if not self._client:
 			return
 
-		await self._client.publish(
-			f"device/{self._settings.serial}/request",
-			json.dumps({"print": {"command": "heartbeat"}}),
-		)
+		await self._client.publish(self._request_topic, _HEARTBEAT_PAYLOAD)
 
 	def _handle_task_crash(self, exc: BaseException) -> None:
 		if not self._is_running:
@@ -282,8 +283,7 @@ class MQTTService:
 		try:
 			self._last_message_at = time.monotonic()
 			await self._debug_service.add_message(self._printer_id, payload)
-			payload_str = payload.decode("utf-8")
-			data = json.loads(payload_str)
+			data = json.loads(payload)
 
 			await self._state_orchestrator.update_print_data(self._printer_id, data)
 		except Exception as exc:  # noqa: BLE001
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import re
 import zipfile
 from datetime import datetime
@@ -28,6 +29,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"1", "true", "yes"})
+_ROOT_REMOTE_PATHS = frozenset({"", "/"})
+
 
 class PrintJobService:
 	def __init__(
@@ -381,7 +385,7 @@ class PrintJobService:
 		parent_remote_path = target_path.parent.as_posix()
 		if not parent_remote_path or parent_remote_path == ".":
 			parent_remote_path = "/"
-		if remote_path in {"", "/"}:
+		if remote_path in _ROOT_REMOTE_PATHS:
 			raise ValueError("Invalid file path")
 		return remote_path, parent_remote_path
 
@@ -1019,7 +1023,9 @@ class PrintJobService:
 		slice_info: dict,
 		model_settings: dict,
 	) -> dict:
-		meta_ok = self._cache_meta_matches(printer_id, filename, remote_path)
+		meta_ok = self._cache_meta_matches_entry(
+			printer_id, filename, {"path": remote_path}, partial=True
+		)
 		plates = slice_info.get("plates", []) if isinstance(slice_info, dict) else []
 		pick_map = self._build_pick_file_map(model_settings, plates)
 		plate_status = []
@@ -1031,19 +1037,24 @@ class PrintJobService:
 				"plates": plate_status,
 			}
 
+		normalize_path = self._normalize_relative_path
+		build_preview_url = self._build_preview_url
+		append_status = plate_status.append
+		extract_dir_str = os.fspath(extract_dir)
+		join_path = os.path.join
+		isfile = os.path.isfile
 		for idx, plate in enumerate(plates):
 			plate_index = plate.get("index")
 			if plate_index is None:
 				plate_index = idx + 1
 			metadata = plate.get("metadata") or {}
 			enabled_raw = str(metadata.get("label_object_enabled", "")).strip().lower()
-			label_enabled = enabled_raw in {"1", "true", "yes"}
+			label_enabled = enabled_raw in _TRUTHY
 			objects = plate.get("objects") or []
 
-			pick_rel = self._normalize_relative_path(pick_map.get(plate_index))
-			pick_path = extract_dir / pick_rel if pick_rel else None
-			pick_exists = bool(pick_path and pick_path.exists())
-			pick_url = self._build_preview_url(printer_id, filename, pick_rel) if pick_exists else None
+			pick_rel = normalize_path(pick_map.get(plate_index))
+			pick_exists = bool(pick_rel) and isfile(join_path(extract_dir_str, pick_rel))
+			pick_url = build_preview_url(printer_id, filename, pick_rel) if pick_exists else None
 
 			reason = None
 			if not meta_ok:
@@ -1055,7 +1066,7 @@ class PrintJobService:
 			elif not objects:
 				reason = "objects_missing"
 
-			plate_status.append(
+			append_status(
 				{
 					"index": plate_index,
 					"available": reason is None,
@@ -1073,22 +1084,6 @@ class PrintJobService:
 			"plates": plate_status,
 		}
 
-	def _cache_meta_matches(self, printer_id: str, filename: str, remote_path: str) -> bool:
-		file_path, meta_path = self._cache.get_paths(printer_id, filename)
-		if not file_path.exists() or not meta_path.exists():
-			return False
-		try:
-			meta = json.loads(meta_path.read_text())
-		except Exception:
-			return False
-		if meta.get("name") != filename:
-			return False
-		if remote_path and meta.get("path") != remote_path:
-			return False
-		if not meta.get("modified") or not meta.get("size"):
-			return False
-		return True
-
 	def _build_pick_file_map(self, model_settings: dict, plates: list[dict]) -> dict[int, str]:
 		pick_map: dict[int, str] = {}
 		for plate in model_settings.get("plates", []) if isinstance(model_settings, dict) else []:
@@ -1109,11 +1104,21 @@ class PrintJobService:
 	def _normalize_relative_path(self, value: str | None) -> str | None:
 		if not value:
 			return None
-		safe_rel = value.strip().lstrip("/").replace("\\", "/")
-		if not safe_rel:
+		# Fast path: already-clean relative paths are returned without allocating.
+		if (
+			value[0] != "/"
+			and "\\" not in value
+			and ".." not in value
+			and not value[0].isspace()
+			and not value[-1].isspace()
+		):
+			return value
+		safe_rel = value.strip().lstrip("/")
+		# A leading backslash would become an absolute path once converted
+		if not safe_rel or safe_rel[0] == "\\":
 			return None
-		target_rel = Path(safe_rel)
-		if target_rel.is_absolute() or ".." in target_rel.parts:
+		safe_rel = safe_rel.replace("\\", "/")
+		if ".." in safe_rel.split("/"):
 			return None
 		return safe_rel
 
@@ -1148,17 +1153,22 @@ class PrintJobService:
 		return None
 
 	def _cache_meta_matches_entry(
-		self, printer_id: str, filename: str, entry: dict
+		self, printer_id: str, filename: str, entry: dict, *, partial: bool = False
 	) -> bool:
+		"""Compare cached meta against a remote entry.
+
+		With ``partial`` only the fields present in ``entry`` are compared; the
+		cached meta must still carry a modified time and size.
+		"""
 		if not filename or not entry:
 			return False
-		file_path, meta_path = self._cache.get_paths(printer_id, filename)
-		if not file_path.exists() or not meta_path.exists():
-			return False
 		modified = entry.get("modified") or ""
 		size = entry.get("size") or ""
 		remote_path = entry.get("path") or ""
-		if not modified or not size or not remote_path:
+		if not partial and (not modified or not size or not remote_path):
+			return False
+		file_path, meta_path = self._cache.get_paths(printer_id, filename)
+		if not file_path.exists() or not meta_path.exists():
 			return False
 		try:
 			meta = json.loads(meta_path.read_text())
@@ -1166,11 +1176,13 @@ class PrintJobService:
 			return False
 		if meta.get("name") != filename:
 			return False
-		if meta.get("modified") != modified:
+		if not meta.get("modified") or not meta.get("size"):
+			return False
+		if modified and meta.get("modified") != modified:
 			return False
-		if meta.get("size") != size:
+		if size and meta.get("size") != size:
 			return False
-		if meta.get("path") != remote_path:
+		if remote_path and meta.get("path") != remote_path:
 			return False
 		return True
 
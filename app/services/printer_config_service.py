@@ -1,6 +1,7 @@
 """Printer configuration and status orchestration helpers."""
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from app.core.config import (
@@ -69,13 +70,9 @@ class PrinterConfigService:
             else None
         )
         last_sent_project_file = state.last_sent_project_file
-        if (
-            last_sent_project_file is None
-            and self._registry.print_job_service
-        ):
-            last_sent_project_file = await self._registry.print_job_service.get_last_sent_project_file(
-                target_id
-            )
+        print_job_service = self._registry.print_job_service
+        if last_sent_project_file is None and print_job_service:
+            last_sent_project_file = await print_job_service.get_last_sent_project_file(target_id)
         uptime_seconds = get_uptime_seconds()
         return StatusResponse(
             printer_online=state.printer_online,
@@ -201,7 +198,8 @@ class PrinterConfigService:
         payload: CreatePrinterRequest,
     ) -> CreatePrinterResponse:
         printers = await list_printer_definitions_async()
-        existing = next((printer for printer in printers if printer.id == printer_id), None)
+        printers_by_id = {printer.id: printer for printer in printers}
+        existing = printers_by_id.get(printer_id)
         if existing is None:
             raise NotFoundError(f"Printer with id '{printer_id}' not found")
 
@@ -318,7 +316,8 @@ class PrinterConfigService:
 
     async def delete_printer(self, printer_id: str) -> DeletePrinterResponse:
         printers = await list_printer_definitions_async()
-        target = next((printer for printer in printers if printer.id == printer_id), None)
+        printers_by_id = {printer.id: printer for printer in printers}
+        target = printers_by_id.get(printer_id)
         if target is None:
             raise NotFoundError(f"Printer with id '{printer_id}' not found")
         if len(printers) <= 1:
@@ -360,14 +359,21 @@ class PrinterConfigService:
         )
 
     async def select_printer(self, payload: SelectPrinterRequest) -> PrinterInfoResponse:
+        settings_task = asyncio.create_task(
+            asyncio.to_thread(get_settings, printer_id=payload.printer_id)
+        )
         try:
-            new_settings = get_settings(printer_id=payload.printer_id)
+            presence_state = await self._presence_service.get_state(payload.printer_id)
+        except BaseException:
+            settings_task.cancel()
+            raise
+        try:
+            new_settings = await settings_task
         except ValueError as exc:
             raise NotFoundError(str(exc)) from exc
         except Exception as exc:  # noqa: BLE001
             raise BadRequestError(str(exc)) from exc
 
-        presence_state = await self._presence_service.get_state(payload.printer_id)
         if presence_state is not None and not presence_state.online:
             raise ConflictError("Secilen yazici cevrim disi oldugu icin aktif edilemez.")
 
@@ -392,10 +398,8 @@ class PrinterConfigService:
         except Exception as exc:  # noqa: BLE001
             raise InternalError(str(exc)) from exc
 
-        target = next(
-            (entry for entry in updated_config.printers if entry.id == printer_id),
-            None,
-        )
+        printers_by_id = {entry.id: entry for entry in updated_config.printers}
+        target = printers_by_id.get(printer_id)
         if target is None:
             raise NotFoundError(f"Printer with id '{printer_id}' not found")
 
@@ -12,6 +12,14 @@ from aiomqtt import Client, MqttError
 
 logger = logging.getLogger(__name__)
 
+_GET_VERSION_PAYLOAD = json.dumps({
+    "info": {
+        "command": "get_version",
+        "sequence_id": "2023",
+        "param": "",
+    }
+}).encode("utf-8")
+
 
 @dataclass
 class DeviceModule:
@@ -59,14 +67,6 @@ class PrinterOnboardingService:
 
         report_topic = f"device/{serial}/report"
         request_topic = f"device/{serial}/request"
-        command_payload = json.dumps({
-            "info": {
-                "command": "get_version",
-                "sequence_id": "2023",
-                "param": "",
-            }
-        })
-
         try:
             async with Client(
                 hostname=printer_ip,
@@ -77,7 +77,7 @@ class PrinterOnboardingService:
                 timeout=10,
             ) as client:
                 await client.subscribe(report_topic)
-                await client.publish(request_topic, command_payload)
+                await client.publish(request_topic, _GET_VERSION_PAYLOAD)
 
                 info_block: dict[str, Any] | None = None
                 messages = client.messages
@@ -86,7 +86,7 @@ class PrinterOnboardingService:
                     message = await asyncio.wait_for(messages.__anext__(), timeout=self._timeout)
                     if not message.topic.matches(report_topic):
                         continue
-                    payload = json.loads(message.payload.decode("utf-8"))
+                    payload = json.loads(message.payload)
                     info = payload.get("info")
                     if info and info.get("command") == "get_version":
                         info_block = info
@@ -5,22 +5,24 @@ watchers pull status updates even when a printer is not the currently
 selected device, and forward every payload through the shared state
 orchestrator so that event hooks, debug tools and the UI can rely on
 cached state for all printers without opening additional MQTT/FTP sessions.
-event hooks, debug tools and the UI can rely on cached state for all
-printers without opening additional MQTT/FTP sessions.
+
+Printers expose their own broker (one host and access code per device), so
+watchers cannot share a connection; one client per printer is the minimum.
 """
 from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
 import ssl
-from datetime import datetime
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
 from typing import Awaitable, Callable, Dict, Optional
 
 from aiomqtt import Client, MqttError
-from pydantic import BaseModel
 
+from app.core import json_codec
 from app.core.config import PrinterConfig, Settings, list_printer_definitions
 from app.core.request_context import clear_request_id, request_context, set_request_id
 from app.core.tasks import monitor_task
@@ -30,14 +32,34 @@ from app.services.utils.backoff import Backoff
 
 logger = logging.getLogger(__name__)
 
+_PUSHALL_PAYLOAD = json_codec.dumps({"pushing": {"command": "pushall"}})
+_GET_VERSION_PAYLOAD = json_codec.dumps({"info": {"command": "get_version"}})
+_HEARTBEAT_PAYLOAD = json_codec.dumps({"print": {"command": "heartbeat"}})
+
+
+def _build_insecure_tls_context() -> ssl.SSLContext:
+	"""Printers use self-signed certificates, so verification is disabled."""
+	ssl_context = ssl.create_default_context()
+	ssl_context.check_hostname = False
+	ssl_context.verify_mode = ssl.CERT_NONE
+	return ssl_context
+
 
-class PrinterPresenceState(BaseModel):
-	"""Simple state snapshot for a printer."""
+@dataclass(frozen=True, slots=True)
+class PrinterPresenceState:
+	"""Immutable state snapshot for a printer; updates replace the instance."""
 
 	online: bool = False
-	last_seen: Optional[datetime] = None
+	# Wall-clock seconds; converted to a datetime only when a snapshot is read.
+	last_seen_epoch: Optional[float] = None
 	last_error: Optional[str] = None
 
+	@property
+	def last_seen(self) -> Optional[datetime]:
+		if self.last_seen_epoch is None:
+			return None
+		return datetime.fromtimestamp(self.last_seen_epoch, timezone.utc)
+
 
 class PrinterPresenceService:
 	"""Maintain a lightweight MQTT watcher per printer to populate caches."""
@@ -49,16 +71,23 @@ class PrinterPresenceService:
 		orchestrator: StateOrchestrator,
 		heartbeat_timeout: float = 10.0,
 		reconnect_delay: float = 5.0,
+		max_concurrent_connects: int = 4,
+		coalesce_window: float = 0.05,
 	) -> None:
 		self._settings = settings
 		self._repository = repository
 		self._orchestrator = orchestrator
 		self._heartbeat_timeout = heartbeat_timeout
 		self._reconnect_delay = reconnect_delay
+		self._coalesce_window = coalesce_window
+		self._ssl_context = _build_insecure_tls_context()
+		# Bounds simultaneous MQTT/TLS handshakes so a fleet reconnect does not stampede.
+		self._connect_slots = asyncio.Semaphore(max(1, max_concurrent_connects))
 		self._states: Dict[str, PrinterPresenceState] = {}
 		self._watchers: Dict[str, PrinterCacheWatcher] = {}
 		self._lock = asyncio.Lock()
 		self._is_running = False
+		repository.add_active_printer_listener(self._on_active_printer_changed)
 
 	async def start(self) -> None:
 		if self._is_running:
@@ -83,7 +112,10 @@ class PrinterPresenceService:
 
 				self._is_running = True
 
-			await asyncio.gather(*(watcher.start() for watcher in self._watchers.values()))
+			# Watcher.start only schedules the watcher task, so awaiting it inline
+			# avoids wrapping every start coroutine in its own gather future.
+			for watcher in list(self._watchers.values()):
+				await watcher.start()
 			logger.info("Printer presence service started for %s printers", len(self._watchers))
 
 	async def stop(self) -> None:
@@ -100,44 +132,53 @@ class PrinterPresenceService:
 		printer_id: str,
 		*,
 		online: bool,
-		last_seen: Optional[datetime] = None,
+		last_seen: Optional[float] = None,
 		error: Optional[str] = None,
 	) -> None:
-		async with self._lock:
-			state = self._states.setdefault(printer_id, PrinterPresenceState())
-			state.online = online
-			if last_seen is not None:
-				state.last_seen = last_seen
-			if online:
-				state.last_error = None
-			elif error is not None:
-				state.last_error = error
+		# Single-key dict assignment is atomic, so the hot path needs no lock.
+		previous = self._states.get(printer_id)
+		if online:
+			last_error = None
+		elif error is not None:
+			last_error = error
+		else:
+			last_error = previous.last_error if previous else None
+		if last_seen is None and previous is not None:
+			last_seen = previous.last_seen_epoch
+		self._states[printer_id] = PrinterPresenceState(
+			online=online,
+			last_seen_epoch=last_seen,
+			last_error=last_error,
+		)
 
 	async def list_states(self) -> Dict[str, PrinterPresenceState]:
-		async with self._lock:
-			snapshot = {printer_id: state.copy(deep=True) for printer_id, state in self._states.items()}
+		snapshot = dict(self._states)
 
 		active_id = self._repository.get_active_printer_id()
 		if active_id:
-			active_state = snapshot.setdefault(active_id, PrinterPresenceState())
+			active_state = snapshot.get(active_id) or PrinterPresenceState()
+			snapshot[active_id] = active_state
 			try:
 				state = await self._repository.get_state(active_id)
 			except Exception:  # noqa: BLE001
 				return snapshot
-			active_state.online = state.printer_online
 			if state.printer_online:
-				active_state.last_seen = datetime.utcnow()
-				active_state.last_error = None
+				snapshot[active_id] = PrinterPresenceState(
+					online=True,
+					last_seen_epoch=time.time(),
+					last_error=None,
+				)
+			else:
+				snapshot[active_id] = replace(active_state, online=False)
 		return snapshot
 
 	async def get_state(self, printer_id: str) -> Optional[PrinterPresenceState]:
-		async with self._lock:
-			state = self._states.get(printer_id)
-			return state.copy(deep=True) if state else None
+		return self._states.get(printer_id)
 
 	async def add_printer(self, printer: PrinterConfig) -> None:
 		"""Start tracking a newly added printer."""
 
+		self._orchestrator.invalidate_printer(printer.id)
 		async with self._lock:
 			self._states.setdefault(printer.id, PrinterPresenceState())
 			watcher = self._build_watcher(printer)
@@ -156,6 +197,11 @@ class PrinterPresenceService:
 		if watcher:
 			await watcher.stop()
 		await self._repository.reset(printer_id)
+		self._orchestrator.invalidate_printer(printer_id)
+
+	def _on_active_printer_changed(self, active_id: Optional[str]) -> None:
+		for printer_id, watcher in self._watchers.items():
+			watcher.set_suspended(printer_id == active_id)
 
 	def _build_watcher(self, printer: PrinterConfig) -> "PrinterCacheWatcher":
 		return PrinterCacheWatcher(
@@ -167,6 +213,9 @@ class PrinterPresenceService:
 			heartbeat_timeout=self._heartbeat_timeout,
 			reconnect_delay=self._reconnect_delay,
 			update_callback=self._update_state,
+			connect_slots=self._connect_slots,
+			coalesce_window=self._coalesce_window,
+			ssl_context=self._ssl_context,
 		)
 
 
@@ -184,6 +233,9 @@ class PrinterCacheWatcher:
 		heartbeat_timeout: float,
 		reconnect_delay: float,
 		update_callback: Callable[..., Awaitable[None]],
+		connect_slots: asyncio.Semaphore | None = None,
+		coalesce_window: float = 0.05,
+		ssl_context: ssl.SSLContext | None = None,
 	) -> None:
 		self._printer = printer
 		self._username = username
@@ -193,9 +245,21 @@ class PrinterCacheWatcher:
 		self._heartbeat_timeout = heartbeat_timeout
 		self._reconnect_delay = reconnect_delay
 		self._update_callback = update_callback
+		self._connect_slots = connect_slots or asyncio.Semaphore(1)
+		self._ssl_context = ssl_context or _build_insecure_tls_context()
+		self._report_topic = f"device/{printer.serial}/report"
+		self._request_topic = f"device/{printer.serial}/request"
 		self._task: Optional[asyncio.Task[None]] = None
 		self._running = False
 		self._heartbeat_sent = False
+		self._last_payload: bytes | None = None
+		# Reports arriving within the coalesce window are merged into one orchestrator update.
+		self._coalesce_window = coalesce_window
+		self._pending_payload: dict | None = None
+		self._pending_deadline = 0.0
+		# Set while the watcher may connect; cleared while its printer is the active one.
+		self._resume_event = asyncio.Event()
+		self.set_suspended(repository.is_active_printer(printer.id))
 		self._backoff = Backoff(base_delay=reconnect_delay, max_delay=max(reconnect_delay, 30.0))
 
 	async def start(self) -> None:
@@ -220,41 +284,54 @@ class PrinterCacheWatcher:
 	async def _run(self) -> None:
 		set_request_id(f"bg:presence:{self._printer.id}")
 		try:
-			ssl_context = ssl.create_default_context()
-			ssl_context.check_hostname = False
-			ssl_context.verify_mode = ssl.CERT_NONE
-			topic = f"device/{self._printer.serial}/report"
-			request_topic = f"device/{self._printer.serial}/request"
+			ssl_context = self._ssl_context
+			report_topic = self._report_topic
+			request_topic = self._request_topic
 
 			while self._running:
-				if self._repository.is_active_printer(self._printer.id):
-					await asyncio.sleep(self._reconnect_delay)
+				if not self._resume_event.is_set():
+					await self._resume_event.wait()
 					continue
 
 				try:
-					async with Client(
-						hostname=self._printer.printer_ip,
-						port=self._mqtt_port,
-						username=self._username,
-						password=self._printer.access_code,
-						tls_context=ssl_context,
-						timeout=10,
-					) as client:
-						await client.subscribe(topic)
-						await client.publish(request_topic, json.dumps({"pushing": {"command": "pushall"}}))
-						await client.publish(request_topic, json.dumps({"info": {"command": "get_version"}}))
+					async with contextlib.AsyncExitStack() as stack:
+						async with self._connect_slots:
+							client = await stack.enter_async_context(
+								Client(
+									hostname=self._printer.printer_ip,
+									port=self._mqtt_port,
+									username=self._username,
+									password=self._printer.access_code,
+									tls_context=ssl_context,
+									timeout=10,
+								)
+							)
+							await client.subscribe(report_topic)
+							await client.publish(request_topic, _PUSHALL_PAYLOAD)
+							await client.publish(request_topic, _GET_VERSION_PAYLOAD)
 						await self._mark_online()
 						self._backoff.reset()
 						self._heartbeat_sent = False
+						self._last_payload = None
 
+						loop = asyncio.get_running_loop()
 						messages = client.messages
 						while self._running:
-							if self._repository.is_active_printer(self._printer.id):
+							if not self._resume_event.is_set():
+								# The main MQTT service owns this printer now; a late
+								# coalesced report would overwrite its fresher state.
+								self._pending_payload = None
 								await self._mark_offline("suspended (active printer)")
 								break
+							timeout = self._heartbeat_timeout
+							if self._pending_payload is not None:
+								timeout = max(0.0, self._pending_deadline - loop.time())
 							try:
-								message = await asyncio.wait_for(messages.__anext__(), timeout=self._heartbeat_timeout)
+								message = await asyncio.wait_for(messages.__anext__(), timeout=timeout)
 							except asyncio.TimeoutError:
+								if self._pending_payload is not None:
+									await self._flush_pending()
+									continue
 								if not self._heartbeat_sent:
 									await self._send_heartbeat(client)
 									continue
@@ -270,8 +347,14 @@ class PrinterCacheWatcher:
 								break
 							else:
 								self._heartbeat_sent = False
-								if message.topic.matches(topic):
+								if message.topic.value == report_topic:
 									await self._handle_payload(message.payload)
+								if (
+									self._pending_payload is not None
+									and loop.time() >= self._pending_deadline
+								):
+									await self._flush_pending()
+						await self._flush_pending()
 				except asyncio.CancelledError:
 					raise
 				except MqttError as exc:
@@ -287,19 +370,45 @@ class PrinterCacheWatcher:
 		finally:
 			clear_request_id()
 
+	def set_suspended(self, suspended: bool) -> None:
+		"""Pause the watcher while its printer is served by the main MQTT service."""
+		if suspended:
+			self._resume_event.clear()
+		else:
+			self._resume_event.set()
+
 	async def _handle_payload(self, payload: bytes) -> None:
+		# Printers repeat identical reports; skip the parse/assemble pipeline for them.
+		if payload == self._last_payload:
+			await self._mark_online()
+			self._heartbeat_sent = False
+			return
 		try:
-			data = json.loads(payload.decode("utf-8"))
+			data = json_codec.loads(payload)
 		except Exception as exc:  # noqa: BLE001
 			logger.debug("Failed to decode payload for %s: %s", self._printer.id, exc)
 			return
 
-		await self._orchestrator.update_print_data(self._printer.id, data)
+		self._last_payload = payload
+		if self._coalesce_window <= 0:
+			await self._orchestrator.update_print_data(self._printer.id, data)
+		elif self._pending_payload is None:
+			self._pending_payload = data
+			self._pending_deadline = asyncio.get_running_loop().time() + self._coalesce_window
+		else:
+			self._pending_payload = self._orchestrator.merge_payloads(self._pending_payload, data)
 		await self._mark_online()
 		self._heartbeat_sent = False
 
+	async def _flush_pending(self) -> None:
+		payload = self._pending_payload
+		if payload is None:
+			return
+		self._pending_payload = None
+		await self._orchestrator.update_print_data(self._printer.id, payload)
+
 	async def _mark_online(self) -> None:
-		await self._update_callback(self._printer.id, online=True, last_seen=datetime.utcnow())
+		await self._update_callback(self._printer.id, online=True, last_seen=time.time())
 		if not self._repository.is_active_printer(self._printer.id):
 			await self._orchestrator.set_printer_online(self._printer.id, True)
 
@@ -310,12 +419,8 @@ class PrinterCacheWatcher:
 		self._heartbeat_sent = False
 
 	async def _send_heartbeat(self, client: Client) -> None:
-		request_topic = f"device/{self._printer.serial}/request"
 		try:
-			await client.publish(
-				request_topic,
-				json.dumps({"print": {"command": "heartbeat"}}),
-			)
+			await client.publish(self._request_topic, _HEARTBEAT_PAYLOAD)
 			self._heartbeat_sent = True
 		except Exception as exc:  # noqa: BLE001
 			logger.warning("Failed to send heartbeat for %s: %s", self._printer.id, exc)
@@ -45,7 +45,7 @@ class ServiceRegistry:
         self._configured_settings = settings
         self.settings = settings or self._build_placeholder_settings()
         self.state_repository = StateRepository()
-        self.state_notifier = StateNotifier()
+        self.state_notifier = StateNotifier(snapshot_provider=self.state_repository.get_state)
         self.capability_resolver = CapabilityResolver()
         self.spool_resolver = SpoolResolver()
         self.filament_capture_service = FilamentCaptureService()
@@ -162,7 +162,7 @@ class ServiceRegistry:
                 logger.info("Starting background services")
                 self._build_print_job_service()
                 self.state_stream_service.reset()
-                start_steps = []
+                start_steps = [self.state_notifier.start, self.state_orchestrator.start]
                 if self._configured_settings and self.connection_orchestrator:
                     start_steps.append(self.connection_orchestrator.start)
                 elif start_presence and self.presence_service:
@@ -177,7 +177,7 @@ class ServiceRegistry:
                 if self.print_job_service:
                     await self.print_job_service.shutdown()
                 await self.state_stream_service.shutdown()
-                stop_steps = []
+                stop_steps = [self.state_notifier.stop, self.state_orchestrator.stop]
                 if self.connection_orchestrator:
                     stop_steps.append(self.connection_orchestrator.stop)
                 elif stop_presence and self.presence_service:
@@ -205,6 +205,7 @@ class ServiceRegistry:
             self._configured_settings = new_settings
             self.settings = new_settings
             self.state_manager.set_active_printer(new_settings.printer_id)
+            self.state_orchestrator.invalidate_printer()
             self._build_services(new_settings)
             self.connection_orchestrator = ConnectionOrchestrator(
                 mqtt_service=self.mqtt_service,
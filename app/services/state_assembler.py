@@ -14,6 +14,9 @@ from app.services.utils.print_again import update_print_again_state
 
 logger = logging.getLogger(__name__)
 
+_STAGE_LABELS_CACHE_SIZE = 64
+_MISSING = object()
+
 
 class StateAssembler:
     """Responsible for translating master payloads into PrinterState."""
@@ -28,23 +31,38 @@ class StateAssembler:
         self._ams_parser = AmsParser()
         self._capability_resolver = capability_resolver or CapabilityResolver()
         self._spool_resolver = spool_resolver or SpoolResolver()
+        self._stage_labels_cache: dict[tuple[int, ...], list[str]] = {}
+        self._serial_by_printer: dict[str, str | None] = {}
+        self._model_by_printer: dict[str, tuple[dict[str, dict[str, Any]], str]] = {}
 
-    async def assemble(self, printer_id: str, master_data: Dict[str, Any], state: PrinterState) -> None:
-        """Update the provided state instance using merged master data."""
+    def assemble(
+        self,
+        printer_id: str,
+        master_data: Dict[str, Any],
+        state: PrinterState,
+        *,
+        module_index: dict[str, dict[str, Any]] | None = None,
+    ) -> None:
+        """Update the provided state instance using merged master data.
+
+        ``module_index`` may be supplied by callers that memoize it; otherwise it
+        is collected from ``master_data``.
+        """
         try:
             print_section = master_data.get("print", master_data)
-            module_index = self._collect_info_modules(master_data)
-            await self._parse_print_data(printer_id, state, print_section, module_index)
+            if module_index is None:
+                module_index = self.collect_info_modules(master_data)
+            self._parse_print_data(printer_id, state, print_section, module_index)
 
             ams_section = master_data.get("ams")
             if not ams_section and isinstance(print_section, dict):
                 ams_section = print_section.get("ams")
             if ams_section:
-                await self._parse_ams_data(printer_id, state, ams_section, module_index)
+                self._parse_ams_data(printer_id, state, ams_section, module_index)
             self._apply_ams_status(state, print_section)
 
             self._spool_resolver.attach_external_spool(state, master_data)
-            printer_model = self._detect_printer_model(module_index, master_data)
+            printer_model = self._detect_printer_model(printer_id, module_index, master_data)
             self._capability_resolver.apply_printer_capabilities(state, printer_model)
             state.ams = self._capability_resolver.apply_ams_capabilities(state.ams)
 
@@ -55,7 +73,7 @@ class StateAssembler:
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to parse master data for %s: %s", printer_id, exc)
 
-    async def _parse_print_data(
+    def _parse_print_data(
         self,
         printer_id: str,
         state: PrinterState,
@@ -63,18 +81,10 @@ class StateAssembler:
         module_index: dict[str, dict[str, Any]] | None,
     ) -> None:
         try:
-            serial = None
-            try:
-                settings = get_settings(printer_id=printer_id)
-                serial = settings.serial
-            except Exception as exc:  # noqa: BLE001
-                logger.debug("Failed to resolve serial for %s: %s", printer_id, exc)
-
+            serial = self._resolve_serial(printer_id)
             parsed = self._print_parser.parse(print_data, module_index, serial=serial)
             state.print = parsed
-            state.print.stage_labels = [
-                resolve_stage_label(code) for code in parsed.stg
-            ]
+            state.print.stage_labels = self._resolve_stage_labels(parsed.stg)
             state.print.stage_current_label = resolve_stage_label(parsed.stg_cur)
             logger.debug(
                 (
@@ -92,7 +102,37 @@ class StateAssembler:
         except Exception as exc:  # noqa: BLE001
             logger.warning("Failed to parse printer data: %s", exc)
 
-    async def _parse_ams_data(
+    def invalidate_serial(self, printer_id: str | None = None) -> None:
+        """Forget cached serials for one printer, or for all when no id is given."""
+        if printer_id is None:
+            self._serial_by_printer.clear()
+        else:
+            self._serial_by_printer.pop(printer_id, None)
+
+    def _resolve_serial(self, printer_id: str) -> str | None:
+        serial = self._serial_by_printer.get(printer_id, _MISSING)
+        if serial is not _MISSING:
+            return serial
+        try:
+            serial = get_settings(printer_id=printer_id).serial
+        except Exception as exc:  # noqa: BLE001
+            # Not cached: a transient config read failure must not hide the serial
+            logger.debug("Failed to resolve serial for %s: %s", printer_id, exc)
+            return None
+        self._serial_by_printer[printer_id] = serial
+        return serial
+
+    def _resolve_stage_labels(self, stages: list[int]) -> list[str]:
+        key = tuple(stages)
+        labels = self._stage_labels_cache.get(key)
+        if labels is None:
+            if len(self._stage_labels_cache) >= _STAGE_LABELS_CACHE_SIZE:
+                self._stage_labels_cache.clear()
+            labels = [resolve_stage_label(code) for code in key]
+            self._stage_labels_cache[key] = labels
+        return list(labels)
+
+    def _parse_ams_data(
         self,
         printer_id: str,
         state: PrinterState,
@@ -123,23 +163,29 @@ class StateAssembler:
         state.ams.ams_status_main = ams_status_main
         state.ams.ams_status_sub = ams_status_sub
 
+    def invalidate_model(self, printer_id: str | None = None) -> None:
+        """Forget memoized printer models for one printer, or for all."""
+        if printer_id is None:
+            self._model_by_printer.clear()
+        else:
+            self._model_by_printer.pop(printer_id, None)
+
     def _detect_printer_model(
         self,
+        printer_id: str,
         module_index: dict[str, dict[str, Any]] | None,
         master_data: Dict[str, Any],
     ) -> str | None:
-        module_index = module_index or {}
-        preferred_modules = ("ota", "mb_core", "mb0")
-        for key in preferred_modules:
-            module = module_index.get(key)
-            if module:
-                product = module.get("product_name")
-                if product:
-                    return str(product)
-        for module in module_index.values():
-            product = module.get("product_name")
-            if product:
-                return str(product)
+        # Models found in get_version modules are memoized for as long as the
+        # caller keeps passing the same module index object.
+        if module_index:
+            cached = self._model_by_printer.get(printer_id)
+            if cached is not None and cached[0] is module_index:
+                return cached[1]
+            model = self._model_from_modules(module_index)
+            if model is not None:
+                self._model_by_printer[printer_id] = (module_index, model)
+                return model
 
         info_block = master_data.get("info")
         if isinstance(info_block, dict):
@@ -155,29 +201,45 @@ class StateAssembler:
 
         return None
 
-    def _collect_info_modules(self, master_data: Dict[str, Any]) -> dict[str, dict[str, Any]]:
-        index: dict[str, dict[str, Any]] = {}
+    @staticmethod
+    def _model_from_modules(module_index: dict[str, dict[str, Any]]) -> str | None:
+        preferred_modules = ("ota", "mb_core", "mb0")
+        for key in preferred_modules:
+            module = module_index.get(key)
+            if module:
+                product = module.get("product_name")
+                if product:
+                    return str(product)
+        for module in module_index.values():
+            product = module.get("product_name")
+            if product:
+                return str(product)
+        return None
 
-        def collect(section: Any) -> None:
-            if not isinstance(section, dict):
-                return
-            if section.get("command") != "get_version":
-                return
+    def collect_info_modules(self, master_data: Dict[str, Any]) -> dict[str, dict[str, Any]]:
+        index: dict[str, dict[str, Any]] = {}
+        print_section = master_data.get("print")
+        sections = (
+            master_data.get("info"),
+            print_section.get("info") if isinstance(print_section, dict) else None,
+        )
+        for section in sections:
+            if not isinstance(section, dict) or section.get("command") != "get_version":
+                continue
             modules = section.get("module")
             if not isinstance(modules, list):
-                return
+                continue
             for module in modules:
                 if not isinstance(module, dict):
                     continue
-                raw_name = str(module.get("name", "") or "").strip().lower()
-                if not raw_name or raw_name in index:
+                name = module.get("name")
+                if not name:
                     continue
-                index[raw_name] = module
-
-        collect(master_data.get("info"))
-        print_section = master_data.get("print")
-        if isinstance(print_section, dict):
-            collect(print_section.get("info"))
+                if not isinstance(name, str):
+                    name = str(name)
+                raw_name = name.strip().lower()
+                if raw_name and raw_name not in index:
+                    index[raw_name] = module
 
         return index
 
@@ -1,7 +1,7 @@
 """Facade that exposes state read/observe APIs while delegating mutations."""
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from app.models import CameraStatus, PrinterState
 from app.services.state_orchestrator import StateOrchestrator
@@ -30,6 +30,11 @@ class StateManager:
     async def get_master_data(self, printer_id: Optional[str] = None) -> Dict[str, Any]:
         return await self._repository.get_master_data(printer_id)
 
+    async def get_state_bundle(
+        self, printer_id: Optional[str] = None
+    ) -> Tuple[PrinterState, Dict[str, Any]]:
+        return await self._repository.get_state_bundle(printer_id)
+
     async def update_print_data(self, printer_id: str, payload: Dict[str, Any]) -> None:
         await self._orchestrator.update_print_data(printer_id, payload)
 
@@ -1,31 +1,134 @@
 """Publish state snapshot updates to registered observers."""
 from __future__ import annotations
 
-import inspect
+import asyncio
+import contextlib
 import logging
-from typing import Awaitable, Callable, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from app.core.tasks import monitor_task
 from app.models import PrinterState
 
-StateHook = Callable[[str, PrinterState], Awaitable[None] | None]
+StateHook = Callable[..., Awaitable[None] | None]
+StateChanges = Dict[str, Any]
+SnapshotProvider = Callable[[str], Awaitable[PrinterState]]
 
 logger = logging.getLogger(__name__)
 
 
 class StateNotifier:
-    """Central dispatcher for printer state change hooks."""
+    """Central dispatcher for printer state change hooks.
 
-    def __init__(self) -> None:
-        self._hooks: List[StateHook] = []
+    Once started, notifications are coalesced: only the latest snapshot per
+    printer is dispatched, at most once per ``coalesce_window`` seconds. Before
+    ``start`` (or after ``stop``) hooks run inline as each update arrives.
 
-    def register(self, hook: StateHook) -> None:
-        self._hooks.append(hook)
+    With a ``snapshot_provider``, hooks receive the repository's shared
+    snapshot taken at dispatch time rather than the writer's live state, so a
+    write landing while an async hook awaits cannot change what it reads.
+    Hooks must treat the state as read-only. Hooks registered
+    with ``with_changes=True`` also receive the serialized ``{path: value}``
+    changes reported by the writer, or ``None`` when the whole state may have
+    changed.
+    """
 
-    async def notify(self, printer_id: str, state: PrinterState) -> None:
-        for hook in self._hooks:
+    def __init__(
+        self,
+        *,
+        coalesce_window: float = 0.05,
+        snapshot_provider: Optional[SnapshotProvider] = None,
+    ) -> None:
+        self._sync_hooks: List[Tuple[StateHook, bool]] = []
+        self._async_hooks: List[Tuple[StateHook, bool]] = []
+        self._coalesce_window = coalesce_window
+        self._snapshot_provider = snapshot_provider
+        self._pending: Dict[str, Tuple[PrinterState, Optional[StateChanges]]] = {}
+        self._wakeup = asyncio.Event()
+        self._drainer: Optional[asyncio.Task[None]] = None
+
+    def register(self, hook: StateHook, *, with_changes: bool = False) -> None:
+        if asyncio.iscoroutinefunction(hook):
+            self._async_hooks.append((hook, with_changes))
+        else:
+            self._sync_hooks.append((hook, with_changes))
+
+    async def start(self) -> None:
+        if self._drainer:
+            return
+        self._drainer = monitor_task(
+            asyncio.create_task(self._drain(), name="state-notifier"),
+            name="state-notifier",
+            logger=logger,
+        )
+
+    async def stop(self) -> None:
+        drainer, self._drainer = self._drainer, None
+        if drainer:
+            drainer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await drainer
+        await self._flush()
+
+    async def notify(
+        self,
+        printer_id: str,
+        state: PrinterState,
+        changes: Optional[StateChanges] = None,
+    ) -> None:
+        if self._drainer is None:
+            await self._dispatch(printer_id, state, changes)
+            return
+        pending = self._pending.get(printer_id)
+        if pending is not None:
+            pending_changes = pending[1]
+            if pending_changes is None or changes is None:
+                changes = None
+            else:
+                changes = {**pending_changes, **changes}
+        self._pending[printer_id] = (state, changes)
+        self._wakeup.set()
+
+    async def _drain(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            if self._coalesce_window > 0:
+                await asyncio.sleep(self._coalesce_window)
+            self._wakeup.clear()
+            await self._flush()
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for printer_id, (state, changes) in pending.items():
+            await self._dispatch(printer_id, state, changes)
+
+    async def _dispatch(
+        self,
+        printer_id: str,
+        state: PrinterState,
+        changes: Optional[StateChanges],
+    ) -> None:
+        if self._snapshot_provider is not None:
+            state = await self._snapshot_provider(printer_id)
+        for hook, with_changes in self._sync_hooks:
             try:
-                result = hook(printer_id, state)
-                if inspect.isawaitable(result):
-                    await result
+                if with_changes:
+                    hook(printer_id, state, changes)
+                else:
+                    hook(printer_id, state)
             except Exception:  # noqa: BLE001
                 logger.warning("State hook failed for printer %s", printer_id)
+
+        if not self._async_hooks:
+            return
+        results = await asyncio.gather(
+            *(
+                hook(printer_id, state, changes) if with_changes else hook(printer_id, state)
+                for hook, with_changes in self._async_hooks
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("State hook failed for printer %s", printer_id)
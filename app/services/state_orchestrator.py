@@ -1,11 +1,14 @@
 """Handle derived state updates by composing repository, assembler, and notifier."""
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import copy
 import logging
-from datetime import datetime
-from pathlib import Path
+import time
 from typing import Any, Dict, Optional
 
+from app.core.tasks import monitor_task
 from app.models import AmsStatus, CameraStatus, LastSentProjectFile, SkipObjectState
 from app.services.filament_capture_service import FilamentCaptureService
 from app.services.utils.capability_resolver import CapabilityResolver
@@ -17,9 +20,18 @@ from app.services.utils.print_again import update_print_again_state
 
 logger = logging.getLogger(__name__)
 
+# Placeholder strings the printer sends for "unknown"; they never overwrite data.
+_SKIP_STRINGS = frozenset({"", "?", "0/0"})
+# [epoch second, "HH:MM:SS"] for the last formatted timestamp.
+_TIME_CACHE: list[Any] = [None, ""]
+
 
 class StateOrchestrator:
-    """Coordinated updater that merges payloads and notifies listeners."""
+    """Coordinated updater that merges payloads and notifies listeners.
+
+    Once started, camera frames are coalesced: only the latest frame per
+    printer is written, at most once per ``camera_flush_interval`` seconds.
+    """
 
     def __init__(
         self,
@@ -31,6 +43,7 @@ class StateOrchestrator:
         filament_capture_service: FilamentCaptureService | None = None,
         assembler: StateAssembler | None = None,
         print_job_service: object | None = None,
+        camera_flush_interval: float = 0.2,
     ) -> None:
         self._repository = repository
         self._notifier = notifier
@@ -42,7 +55,30 @@ class StateOrchestrator:
             spool_resolver=self._spool_resolver,
         )
         self._print_job_service = print_job_service
-        self._skip_object_file_cache: dict[str, str] = {}
+        # printer_id -> (raw print filename, derived safe name)
+        self._skip_object_file_cache: dict[str, tuple[str, str]] = {}
+        self._module_index_cache: dict[str, tuple[tuple[Any, ...], dict[str, dict[str, Any]]]] = {}
+        self._camera_flush_interval = camera_flush_interval
+        self._camera_frames_pending: dict[str, str] = {}
+        self._camera_frame_event = asyncio.Event()
+        self._camera_flusher: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._camera_flusher:
+            return
+        self._camera_flusher = monitor_task(
+            asyncio.create_task(self._camera_flush_loop(), name="camera-frame-flush"),
+            name="camera-frame-flush",
+            logger=logger,
+        )
+
+    async def stop(self) -> None:
+        flusher, self._camera_flusher = self._camera_flusher, None
+        if flusher:
+            flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await flusher
+        await self._flush_camera_frames()
 
     def set_print_job_service(self, service: object | None) -> None:
         self._print_job_service = service
@@ -54,10 +90,16 @@ class StateOrchestrator:
             logger.warning("Failed to capture filament payload: %s", exc)
 
         async def _update(store: Any):
-            store.master_data = self._deep_merge(store.master_data, payload)
-            await self._assembler.assemble(printer_id, store.master_data, store.state)
+            self._deep_merge_inplace(store.master_data, payload)
+            module_index = self._resolve_module_index(printer_id, store.master_data)
+            self._assembler.assemble(
+                printer_id,
+                store.master_data,
+                store.state,
+                module_index=module_index,
+            )
             await self._maybe_update_skip_object_state(printer_id, store)
-            return store.state.copy(deep=True)
+            return store.state
 
         state_snapshot = await self._repository.update_store(printer_id, _update)
         await self._notifier.notify(printer_id, state_snapshot)
@@ -71,7 +113,7 @@ class StateOrchestrator:
             store.state.last_sent_project_file = record
             update_print_again_state(store.state)
             store.state.updated_at = self._current_time()
-            return store.state.copy(deep=True)
+            return store.state
 
         state_snapshot = await self._repository.update_store(printer_id, _update)
         await self._notifier.notify(printer_id, state_snapshot)
@@ -83,10 +125,13 @@ class StateOrchestrator:
         if not filename:
             store.state.print.skip_object_state = None
             return
-        safe_name = Path(str(filename)).name
-        last_file = self._skip_object_file_cache.get(printer_id)
-        if last_file == safe_name and store.state.print.skip_object_state is not None:
-            return
+        cached = self._skip_object_file_cache.get(printer_id)
+        if cached is not None and cached[0] == filename:
+            if store.state.print.skip_object_state is not None:
+                return
+            safe_name = cached[1]
+        else:
+            safe_name = str(filename).rstrip("/").rsplit("/", 1)[-1]
         result = await self._print_job_service.get_cached_metadata_result_local(
             printer_id,
             safe_name,
@@ -99,7 +144,7 @@ class StateOrchestrator:
                 store.state.print.skip_object_state = SkipObjectState(**skip_payload)
             except Exception:
                 store.state.print.skip_object_state = None
-        self._skip_object_file_cache[printer_id] = safe_name
+        self._skip_object_file_cache[printer_id] = (filename, safe_name)
 
     async def set_skip_object_state(
         self,
@@ -115,28 +160,58 @@ class StateOrchestrator:
                 except Exception:
                     store.state.print.skip_object_state = None
             store.state.updated_at = self._current_time()
-            return store.state.copy(deep=True)
+            skip_state = store.state.print.skip_object_state
+            return store.state, {
+                "print.skip_object_state": skip_state.model_dump(mode="json") if skip_state else None,
+                "updated_at": store.state.updated_at,
+            }
 
-        state_snapshot = await self._repository.update_store(printer_id, _update)
-        await self._notifier.notify(printer_id, state_snapshot)
+        state_snapshot, changes = await self._repository.update_store(printer_id, _update)
+        await self._notifier.notify(printer_id, state_snapshot, changes)
 
     async def update_camera_frame(self, printer_id: str, frame: str) -> None:
+        if self._camera_flusher is None:
+            await self._write_camera_frame(printer_id, frame)
+            return
+        self._camera_frames_pending[printer_id] = frame
+        self._camera_frame_event.set()
+
+    async def _write_camera_frame(self, printer_id: str, frame: str) -> None:
         async def _update(store: Any):
             store.state.camera_frame = frame
             store.state.updated_at = self._current_time()
+            # The stream serialization excludes frames, so keep it cached.
+            store.mark_changed(serialized=False)
 
         await self._repository.update_store(printer_id, _update)
 
+    async def _camera_flush_loop(self) -> None:
+        while True:
+            await self._camera_frame_event.wait()
+            self._camera_frame_event.clear()
+            await self._flush_camera_frames()
+            if self._camera_flush_interval > 0:
+                await asyncio.sleep(self._camera_flush_interval)
+
+    async def _flush_camera_frames(self) -> None:
+        if not self._camera_frames_pending:
+            return
+        pending, self._camera_frames_pending = self._camera_frames_pending, {}
+        for printer_id, frame in pending.items():
+            await self._write_camera_frame(printer_id, frame)
+
     async def set_printer_online(self, printer_id: str, online: bool) -> None:
         async def _update(store: Any):
             store.state.printer_online = online
+            store.state.updated_at = self._current_time()
+            changes = {"printer_online": online, "updated_at": store.state.updated_at}
             if not online:
                 store.state.ams = AmsStatus()
-            store.state.updated_at = self._current_time()
-            return store.state.copy(deep=True)
+                changes["ams"] = store.state.ams.model_dump(mode="json")
+            return store.state, changes
 
-        state_snapshot = await self._repository.update_store(printer_id, _update)
-        await self._notifier.notify(printer_id, state_snapshot)
+        state_snapshot, changes = await self._repository.update_store(printer_id, _update)
+        await self._notifier.notify(printer_id, state_snapshot, changes)
 
     async def set_ftps_status(self, printer_id: str, status: str) -> None:
         async def _update(store: Any):
@@ -144,11 +219,11 @@ class StateOrchestrator:
                 return None
             store.state.ftps_status = status
             store.state.updated_at = self._current_time()
-            return store.state.copy(deep=True)
+            return store.state, {"ftps_status": status, "updated_at": store.state.updated_at}
 
-        state_snapshot = await self._repository.update_store(printer_id, _update)
-        if state_snapshot:
-            await self._notifier.notify(printer_id, state_snapshot)
+        result = await self._repository.update_store(printer_id, _update)
+        if result:
+            await self._notifier.notify(printer_id, *result)
 
     async def set_camera_status(
         self,
@@ -165,27 +240,94 @@ class StateOrchestrator:
             store.state.camera_status = status
             store.state.camera_status_reason = reason
             store.state.updated_at = self._current_time()
-            return store.state.copy(deep=True)
+            return store.state, {
+                "camera_status": CameraStatus(status).value,
+                "camera_status_reason": reason,
+                "updated_at": store.state.updated_at,
+            }
 
-        state_snapshot = await self._repository.update_store(printer_id, _update)
-        if state_snapshot:
-            await self._notifier.notify(printer_id, state_snapshot)
-
-    def _deep_merge(self, master: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
-        result = master.copy()
-
-        for key, value in new.items():
-            if isinstance(value, dict) and isinstance(result.get(key), dict):
-                result[key] = self._deep_merge(result[key], value)
-            elif value in (None, "", "?", "0/0"):
-                continue
-            elif isinstance(value, str) and not value.strip():
-                continue
-            else:
-                result[key] = value
+        result = await self._repository.update_store(printer_id, _update)
+        if result:
+            await self._notifier.notify(printer_id, *result)
+
+    def invalidate_printer(self, printer_id: str | None = None) -> None:
+        """Drop per-printer caches after a printer is removed or reconfigured."""
+        if printer_id is None:
+            self._module_index_cache.clear()
+        else:
+            self._module_index_cache.pop(printer_id, None)
+        self._assembler.invalidate_serial(printer_id)
+        self._assembler.invalidate_model(printer_id)
+
+    def merge_payloads(self, base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge ``update`` into ``base`` in place using the master-data merge rules."""
+        self._deep_merge_inplace(base, update)
+        return base
+
+    def _resolve_module_index(
+        self,
+        printer_id: str,
+        master_data: Dict[str, Any],
+    ) -> dict[str, dict[str, Any]]:
+        """Return the get_version module index, rebuilding it only when modules change.
+
+        Module lists are replaced (never mutated) by merges, so identity of the
+        list objects is enough to detect a new get_version response.
+        """
+        print_section = master_data.get("print")
+        print_info = print_section.get("info") if isinstance(print_section, dict) else None
+        signature = (
+            *self._version_signature(master_data.get("info")),
+            *self._version_signature(print_info),
+        )
+        cached = self._module_index_cache.get(printer_id)
+        if cached is not None:
+            cached_signature, module_index = cached
+            if (
+                cached_signature[0] == signature[0]
+                and cached_signature[1] is signature[1]
+                and cached_signature[2] == signature[2]
+                and cached_signature[3] is signature[3]
+            ):
+                return module_index
 
-        return result
+        module_index = self._assembler.collect_info_modules(master_data)
+        self._module_index_cache[printer_id] = (signature, module_index)
+        return module_index
+
+    @staticmethod
+    def _version_signature(section: Any) -> tuple[Any, Any]:
+        if not isinstance(section, dict):
+            return None, None
+        return section.get("command"), section.get("module")
+
+    @staticmethod
+    def _deep_merge_inplace(dest: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Merge ``new`` into ``dest``, skipping empty/placeholder leaf values."""
+        stack = [(dest, new)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                value_type = type(value)
+                if value_type is dict:
+                    current = target.get(key)
+                    if type(current) is dict:
+                        stack.append((current, value))
+                        continue
+                    # Own the subtree so later merges never mutate the caller's payload
+                    value = copy.deepcopy(value)
+                elif value is None:
+                    continue
+                elif value_type is str and (value in _SKIP_STRINGS or not value.strip()):
+                    continue
+                target[key] = value
 
     @staticmethod
     def _current_time() -> str:
-        return datetime.now().strftime("%H:%M:%S")
+        now = int(time.time())
+        cache = _TIME_CACHE
+        if cache[0] != now:
+            local = time.localtime(now)
+            cache[0] = now
+            cache[1] = f"{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}"
+        return cache[1]
@@ -2,23 +2,39 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
-from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+import copy
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 
 from app.models import PrinterState
 
 T = TypeVar("T")
-StateStoreUpdater = Callable[["_PrinterStore"], Awaitable[T] | T]
+StateStoreUpdater = Callable[["_PrinterStore"], Awaitable[T]]
 
 
 class _PrinterStore:
-    """Tuple of the cached PrinterState plus its payload and lock."""
+    """Tuple of the cached PrinterState plus its payload and lock.
+
+    ``snapshot`` and ``serialized`` are read-only copies of ``state`` shared by
+    readers; they are built on the first read after a change and dropped by
+    ``mark_changed``, which also bumps ``version``. While they are set, readers
+    take them without the lock, so a read during a write sees the state as it
+    was before that write.
+    """
 
     def __init__(self) -> None:
         self.state = PrinterState()
         self.master_data: Dict[str, Any] = {}
+        self.version = 0
+        self.snapshot: Optional[PrinterState] = None
+        self.serialized: Optional[Dict[str, Any]] = None
         self.lock = asyncio.Lock()
 
+    def mark_changed(self, *, serialized: bool = True) -> None:
+        self.version += 1
+        self.snapshot = None
+        if serialized:
+            self.serialized = None
+
 
 class StateRepository:
     """Maintain per-printer caches and expose guarded accessors.
@@ -31,9 +47,21 @@ class StateRepository:
         self._stores: Dict[str, _PrinterStore] = {}
         self._stores_lock = asyncio.Lock()
         self._active_printer_id: Optional[str] = None
+        self._active_printer_listeners: list[Callable[[Optional[str]], None]] = []
+        self._reset_listeners: list[Callable[[Optional[str]], None]] = []
 
     def set_active_printer(self, printer_id: str) -> None:
         self._active_printer_id = printer_id
+        for listener in list(self._active_printer_listeners):
+            listener(printer_id)
+
+    def add_active_printer_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """Register a synchronous callback invoked whenever the active printer changes."""
+        self._active_printer_listeners.append(listener)
+
+    def add_reset_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        """Register a synchronous callback invoked after a printer (or ``None`` for all) is reset."""
+        self._reset_listeners.append(listener)
 
     def get_active_printer_id(self) -> Optional[str]:
         return self._active_printer_id
@@ -42,13 +70,38 @@ class StateRepository:
         return printer_id == self._active_printer_id
 
     async def get_state(self, printer_id: Optional[str] = None) -> PrinterState:
+        """Return a snapshot of the printer state; callers must not mutate it."""
         printer_id = printer_id or self._active_printer_id
         if not printer_id:
             return PrinterState()
 
         store = await self._get_store(printer_id)
+        snapshot = store.snapshot
+        if snapshot is not None:
+            return snapshot
         async with store.lock:
-            return store.state.copy(deep=True)
+            if store.snapshot is None:
+                store.snapshot = store.state.copy(deep=True)
+            return store.snapshot
+
+    async def get_state_dict(self, printer_id: str) -> Dict[str, Any]:
+        """Return the JSON-ready printer state, cached until the next change.
+
+        ``camera_frame`` is left out: frames are served by the camera endpoint
+        and would otherwise be re-sent with every state diff. The returned dict
+        is shared between callers and must not be mutated.
+        """
+        store = await self._get_store(printer_id)
+        serialized = store.serialized
+        if serialized is not None:
+            return serialized
+        async with store.lock:
+            if store.serialized is None:
+                store.serialized = store.state.model_dump(
+                    mode="json",
+                    exclude={"camera_frame"},
+                )
+            return store.serialized
 
     async def get_master_data(self, printer_id: Optional[str] = None) -> Dict[str, Any]:
         printer_id = printer_id or self._active_printer_id
@@ -57,27 +110,53 @@ class StateRepository:
 
         store = await self._get_store(printer_id)
         async with store.lock:
-            return store.master_data.copy()
+            return copy.deepcopy(store.master_data)
 
-    async def reset(self, printer_id: Optional[str] = None) -> None:
-        if printer_id is not None:
-            async with self._stores_lock:
-                self._stores.pop(printer_id, None)
-            return
+    async def get_state_bundle(
+        self, printer_id: Optional[str] = None
+    ) -> Tuple[PrinterState, Dict[str, Any]]:
+        """Return the state snapshot and a master data copy read under one lock."""
+        printer_id = printer_id or self._active_printer_id
+        if not printer_id:
+            return PrinterState(), {}
 
+        store = await self._get_store(printer_id)
+        async with store.lock:
+            if store.snapshot is None:
+                store.snapshot = store.state.copy(deep=True)
+            return store.snapshot, copy.deepcopy(store.master_data)
+
+    async def reset(self, printer_id: Optional[str] = None) -> None:
         async with self._stores_lock:
-            self._stores.clear()
+            if printer_id is not None:
+                self._stores.pop(printer_id, None)
+            else:
+                self._stores.clear()
+        for listener in list(self._reset_listeners):
+            listener(printer_id)
 
     async def update_store(self, printer_id: str, updater: StateStoreUpdater[T]) -> T:
-        """Update the store for a printer (intended for orchestrator use only)."""
+        """Update the store for a printer (intended for orchestrator use only).
+
+        Updaters are coroutine functions. They return ``None`` when nothing
+        changed (or after calling ``store.mark_changed`` themselves); any other
+        result, or an exception, invalidates the cached snapshots.
+        """
         store = await self._get_store(printer_id)
         async with store.lock:
-            result = updater(store)
-            if inspect.isawaitable(result):
-                return await result
+            try:
+                result = await updater(store)
+            except BaseException:
+                store.mark_changed()
+                raise
+            if result is not None:
+                store.mark_changed()
             return result
 
     async def _get_store(self, printer_id: str) -> _PrinterStore:
+        store = self._stores.get(printer_id)
+        if store is not None:
+            return store
         async with self._stores_lock:
             if printer_id not in self._stores:
                 self._stores[printer_id] = _PrinterStore()
@@ -3,8 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
@@ -21,6 +22,28 @@ from app.services.state_repository import StateRepository
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+SERVER_INFO_TTL = 0.5
+_server_info_cache: Optional[dict[str, Any]] = None
+_server_info_cache_ts = 0.0
+
+
+def _server_info() -> dict[str, Any]:
+    """Return the server_info block, rebuilt at most every SERVER_INFO_TTL seconds."""
+    global _server_info_cache, _server_info_cache_ts
+    now = time.monotonic()
+    if _server_info_cache is None or now - _server_info_cache_ts > SERVER_INFO_TTL:
+        uptime_seconds = get_uptime_seconds()
+        _server_info_cache = {
+            'start_time': get_server_start_time().isoformat(),
+            'server_time': get_server_time().isoformat(),
+            'uptime': format_uptime(uptime_seconds),
+            'uptime_seconds': uptime_seconds,
+        }
+        _server_info_cache_ts = now
+    return _server_info_cache
+
 
 @dataclass(eq=False)
 class _Subscriber:
@@ -32,14 +55,23 @@ class _Subscriber:
 class StateStreamService:
     """Publish full snapshots and diffs to SSE subscribers."""
 
-    def __init__(self, repository: StateRepository, notifier: StateNotifier) -> None:
+    def __init__(
+        self,
+        repository: StateRepository,
+        notifier: StateNotifier,
+        *,
+        max_snapshots: int = 32,
+    ) -> None:
         self._repository = repository
-        self._subscribers: set[_Subscriber] = set()
-        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._subscribers: dict[Optional[str], set[_Subscriber]] = {}
+        # Least recently updated printers first; capped at max_snapshots.
+        self._snapshots: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self._versions: dict[str, int] = {}
+        self._max_snapshots = max_snapshots
         self._lock = asyncio.Lock()
         self._shutdown_event = asyncio.Event()
-        notifier.register(self._handle_state_update)
+        notifier.register(self._handle_state_update, with_changes=True)
+        repository.add_reset_listener(self._forget)
 
     def is_shutdown(self) -> bool:
         return self._shutdown_event.is_set()
@@ -50,7 +82,7 @@ class StateStreamService:
     async def shutdown(self) -> None:
         self._shutdown_event.set()
         async with self._lock:
-            subscribers = list(self._subscribers)
+            subscribers = [sub for bucket in self._subscribers.values() for sub in bucket]
             self._subscribers.clear()
         for sub in subscribers:
             with contextlib.suppress(asyncio.QueueEmpty):
@@ -63,19 +95,24 @@ class StateStreamService:
         queue: asyncio.Queue = asyncio.Queue(maxsize=200)
         subscriber = _Subscriber(queue=queue, printer_id=printer_id)
         async with self._lock:
-            self._subscribers.add(subscriber)
+            self._subscribers.setdefault(subscriber.printer_id, set()).add(subscriber)
         return subscriber
 
     async def unsubscribe(self, subscriber: _Subscriber) -> None:
         async with self._lock:
-            self._subscribers.discard(subscriber)
+            self._discard(subscriber)
+
+    def _discard(self, subscriber: _Subscriber) -> None:
+        bucket = self._subscribers.get(subscriber.printer_id)
+        if bucket is None:
+            return
+        bucket.discard(subscriber)
+        if not bucket:
+            del self._subscribers[subscriber.printer_id]
 
     async def build_snapshot(self, printer_id: str) -> dict[str, Any]:
-        state = await self._repository.get_state(printer_id)
-        state_dict = self._serialize_state(state)
-        version = self._versions.get(printer_id, 0) + 1
-        self._versions[printer_id] = version
-        self._snapshots[printer_id] = state_dict
+        state_dict = await self._serialize_state(printer_id)
+        version = self._remember(printer_id, state_dict)
         return {
             "version": version,
             "ts": datetime.utcnow().isoformat(),
@@ -83,26 +120,33 @@ class StateStreamService:
             "state": state_dict,
         }
 
-    async def _handle_state_update(self, printer_id: str, state: PrinterState) -> None:
+    async def _handle_state_update(
+        self,
+        printer_id: str,
+        state: PrinterState,
+        changes: Optional[dict[str, Any]] = None,
+    ) -> None:
         try:
-            payload = self._build_diff_payload(printer_id, state)
+            payload = await self._build_diff_payload(printer_id, changes)
             if not payload:
                 return
             await self._broadcast(payload["printer_id"], payload)
         except Exception as exc:  # noqa: BLE001
             logger.warning("State stream publish failed: %s", exc)
 
-    def _build_diff_payload(
+    async def _build_diff_payload(
         self,
         printer_id: str,
-        state: PrinterState,
+        changes: Optional[dict[str, Any]] = None,
     ) -> Optional[dict[str, Any]]:
-        current = self._serialize_state(state)
         previous = self._snapshots.get(printer_id)
+        if changes is not None and previous is not None:
+            current, changes = self._apply_changes(previous, changes)
+            return self._diff_payload(printer_id, current, changes)
+
+        current = await self._serialize_state(printer_id)
         if previous is None:
-            version = self._versions.get(printer_id, 0) + 1
-            self._versions[printer_id] = version
-            self._snapshots[printer_id] = current
+            version = self._remember(printer_id, current)
             return {
                 "event": "snapshot",
                 "id": version,
@@ -115,14 +159,20 @@ class StateStreamService:
                 "printer_id": printer_id,
             }
 
-        changes: dict[str, Any] = {}
+        changes = {}
         self._diff_dict(previous, current, "", changes)
+        return self._diff_payload(printer_id, current, changes)
+
+    def _diff_payload(
+        self,
+        printer_id: str,
+        current: dict[str, Any],
+        changes: dict[str, Any],
+    ) -> Optional[dict[str, Any]]:
         if not changes:
             return None
 
-        version = self._versions.get(printer_id, 0) + 1
-        self._versions[printer_id] = version
-        self._snapshots[printer_id] = current
+        version = self._remember(printer_id, current)
         return {
             "event": "diff",
             "id": version,
@@ -135,22 +185,41 @@ class StateStreamService:
             "printer_id": printer_id,
         }
 
+    def _remember(self, printer_id: str, snapshot: dict[str, Any]) -> int:
+        """Store the latest snapshot for a printer and return its new version."""
+        version = self._versions.get(printer_id, 0) + 1
+        self._versions[printer_id] = version
+        self._snapshots[printer_id] = snapshot
+        self._snapshots.move_to_end(printer_id)
+        while len(self._snapshots) > self._max_snapshots:
+            # Versions survive eviction so SSE ids never go backwards; only a reset clears them
+            self._snapshots.popitem(last=False)
+        return version
+
+    def _forget(self, printer_id: Optional[str]) -> None:
+        """Drop cached snapshots after the repository resets a printer (or all)."""
+        if printer_id is None:
+            self._snapshots.clear()
+            self._versions.clear()
+            return
+        self._snapshots.pop(printer_id, None)
+        self._versions.pop(printer_id, None)
+
     async def _broadcast(self, printer_id: str, payload: dict[str, Any]) -> None:
         if self._shutdown_event.is_set():
             return
         dead: list[_Subscriber] = []
         async with self._lock:
-            for sub in self._subscribers:
-                if sub.printer_id and sub.printer_id != printer_id:
-                    continue
-                try:
-                    sub.queue.put_nowait(payload)
-                except asyncio.QueueFull:
-                    dead.append(sub)
+            for key in (printer_id, None):
+                for sub in self._subscribers.get(key, ()):
+                    try:
+                        sub.queue.put_nowait(payload)
+                    except asyncio.QueueFull:
+                        dead.append(sub)
         if dead:
             async with self._lock:
                 for sub in dead:
-                    self._subscribers.discard(sub)
+                    self._discard(sub)
             for sub in dead:
                 self._drain_queue(sub.queue)
                 with contextlib.suppress(asyncio.QueueFull):
@@ -163,41 +232,76 @@ class StateStreamService:
             while True:
                 queue.get_nowait()
 
-    @staticmethod
-    def _serialize_state(state: PrinterState) -> dict[str, Any]:
-        try:
-            state_dict = state.dict()
-        except AttributeError:
-            state_dict = json.loads(state.json())
-        uptime_seconds = get_uptime_seconds()
-        state_dict['server_info'] = {
-            'start_time': get_server_start_time().isoformat(),
-            'server_time': get_server_time().isoformat(),
-            'uptime': format_uptime(uptime_seconds),
-            'uptime_seconds': uptime_seconds,
-        }
-        return state_dict
+    async def _serialize_state(self, printer_id: str) -> dict[str, Any]:
+        """Combine the repository's cached state dict with current server info.
 
-    def _diff_dict(
+        The nested dicts are shared with the repository cache and other
+        snapshots, so they are only ever replaced, never mutated.
+        """
+        state_dict = await self._repository.get_state_dict(printer_id)
+        return {**state_dict, 'server_info': _server_info()}
+
+    def _apply_changes(
         self,
+        previous: dict[str, Any],
+        changes: dict[str, Any],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Apply writer-reported ``{path: value}`` changes to a copy of ``previous``.
+
+        Returns the new snapshot and the leaf changes that differ from it. Only
+        the dicts along each changed path are copied.
+        """
+        current = dict(previous)
+        copied: set[int] = {id(current)}
+        effective: dict[str, Any] = {}
+        for path, value in changes.items():
+            *parents, leaf = path.split(".")
+            target = current
+            for key in parents:
+                child = target.get(key)
+                if not isinstance(child, dict):
+                    child = {}
+                elif id(child) not in copied:
+                    child = dict(child)
+                copied.add(id(child))
+                target[key] = child
+                target = child
+            old_value = target.get(leaf)
+            if isinstance(value, dict) and isinstance(old_value, dict):
+                self._diff_dict(old_value, value, path, effective)
+            elif leaf not in target or old_value != value:
+                effective[path] = value
+            target[leaf] = value
+        return current, effective
+
+    @staticmethod
+    def _diff_dict(
         previous: dict[str, Any],
         current: dict[str, Any],
         prefix: str,
         out: dict[str, Any],
     ) -> None:
-        for key, value in current.items():
-            path = f"{prefix}.{key}" if prefix else key
-            if key not in previous:
-                out[path] = value
-                continue
-            old_value = previous[key]
-            if isinstance(value, dict) and isinstance(old_value, dict):
-                self._diff_dict(old_value, value, path, out)
-                continue
-            if value != old_value:
-                out[path] = value
-
-        for key in previous.keys():
-            if key not in current:
-                path = f"{prefix}.{key}" if prefix else key
-                out[path] = None
+        """Record ``{path: value}`` for every leaf that differs between the dicts.
+
+        Subtrees shared by reference between both snapshots are skipped.
+        """
+        stack = [(previous, current, prefix)]
+        while stack:
+            old_dict, new_dict, base = stack.pop()
+            for key, value in new_dict.items():
+                old_value = old_dict.get(key, _MISSING)
+                if old_value is value:
+                    continue
+                path = f"{base}.{key}" if base else key
+                if old_value is _MISSING:
+                    out[path] = value
+                elif type(value) is dict and type(old_value) is dict:
+                    stack.append((old_value, value, path))
+                elif value != old_value:
+                    out[path] = value
+
+            removed = old_dict.keys() - new_dict.keys()
+            if removed:
+                separator = f"{base}." if base else ""
+                for key in removed:
+                    out[separator + key] = None
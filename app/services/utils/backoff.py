@@ -17,6 +17,11 @@ class Backoff:
         self._attempt = 0
         # Calculate the maximum attempts before hitting max_delay
         self._max_attempts_for_max_delay = self._calculate_max_attempts_for_max_delay()
+        # Un-jittered delays for the attempts before max_delay is reached
+        self._schedule: tuple[float, ...] = tuple(
+            min(self.max_delay, self.base_delay * (self.factor ** attempt))
+            for attempt in range(self._max_attempts_for_max_delay)
+        )
     
     def _calculate_max_attempts_for_max_delay(self) -> int:
         """Calculate how many attempts until delay reaches max_delay."""
@@ -37,22 +42,14 @@ class Backoff:
         self._attempt = 0
 
     def next_delay(self) -> float:
-        # Cap the effective attempt to prevent overflow
-        if self._attempt >= self._max_attempts_for_max_delay:
-            # We've already reached max_delay, just return it with jitter
-            delay = self.max_delay
+        schedule = self._schedule
+        attempt = self._attempt
+        if attempt < len(schedule):
+            delay = schedule[attempt]
+            # Stop counting once saturated so long retry loops don't grow the counter
+            self._attempt = attempt + 1
         else:
-            try:
-                # Safe calculation with bounded exponent
-                delay = self.base_delay * (self.factor ** self._attempt)
-            except OverflowError:
-                # Extreme fallback: use max_delay if calculation overflows
-                delay = self.max_delay
-        
-        self._attempt += 1
-        
-        # Ensure we don't exceed max_delay (safety check)
-        delay = min(self.max_delay, delay)
+            delay = self.max_delay
         
         # Apply jitter if configured
         if self.jitter:
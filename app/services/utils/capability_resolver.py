@@ -17,13 +17,11 @@ class CapabilityResolver:
         state.capabilities = resolved
 
     def apply_ams_capabilities(self, ams_status: AmsStatus) -> AmsStatus:
-        """Decorate AMS units with capability flags."""
-        if not ams_status.ams_units:
-            return ams_status
+        """Decorate AMS units with capability flags in place.
 
-        updated_units = []
+        The live state is written only by the orchestrator under the store
+        lock; readers receive it as read-only and must not modify it.
+        """
         for unit in ams_status.ams_units:
-            caps = resolve_ams_capabilities(unit.product_name)
-            updated_units.append(unit.copy(update={"capabilities": caps}))
-
-        return ams_status.copy(update={"ams_units": updated_units})
+            unit.capabilities = resolve_ams_capabilities(unit.product_name)
+        return ams_status
@@ -1,27 +1,36 @@
 """Helper functions for FTPS service formatting."""
 from datetime import datetime
 
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
+_SIZE_DIVISORS = (1, 1024, 1024 ** 2, 1024 ** 3)
+
 
 def format_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB"]
-    index = 0
-    size = float(size_bytes)
-
-    while size >= 1024 and index < len(units) - 1:
-        size /= 1024.0
-        index += 1
-
-    return f"{size:.1f} {units[index]}"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    index = 0 if size_bytes < 1024 else min((size_bytes.bit_length() - 1) // 10, 3)
+    return f"{size_bytes / _SIZE_DIVISORS[index]:.1f} {_SIZE_UNITS[index]}"
 
 
 def format_date(date_str: str) -> str:
     try:
         if len(date_str) == 14:
-            dt = datetime.strptime(date_str, "%Y%m%d%H%M%S")
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
+            if date_str.isdigit():
+                # Slicing avoids strptime's locale and regex machinery
+                dt = datetime(
+                    int(date_str[0:4]),
+                    int(date_str[4:6]),
+                    int(date_str[6:8]),
+                    int(date_str[8:10]),
+                    int(date_str[10:12]),
+                    int(date_str[12:14]),
+                )
+            else:
+                dt = datetime.strptime(date_str, "%Y%m%d%H%M%S")
+            return dt.strftime(_DATE_FORMAT)
         return date_str
     except Exception:  # noqa: BLE001
         return "Unknown"
@@ -2,13 +2,24 @@ import contextlib
 import ftplib
 import logging
 import os
+import socket
 import ssl
+import tempfile
+from dataclasses import dataclass
 from threading import Event
-from typing import BinaryIO, Callable, Optional
+from typing import BinaryIO, Callable, Iterator, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
 ProgressCallback = Optional[Callable[[int, Optional[int]], None]]
+# (file_index, sent, total, total_files)
+BatchProgressCallback = Optional[Callable[[int, int, Optional[int], int], None]]
+
+# Large blocks keep the Python-level read/send loop short for multi-MB uploads.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Bounds for caller-supplied chunk sizes: tiny blocks mean a syscall storm, huge ones waste RAM.
+MIN_UPLOAD_CHUNK_SIZE = 256 * 1024
+MAX_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
 
 
 class UploadCancelledError(Exception):
@@ -27,8 +38,11 @@ class ImplicitFTP_TLS(ftplib.FTP_TLS):
 			context = ssl.create_default_context()
 			context.check_hostname = False
 			context.verify_mode = ssl.CERT_NONE
+			# Let OpenSSL hand records to the kernel where supported (Python 3.12+)
+			context.options |= getattr(ssl, "OP_ENABLE_KTLS", 0)
 		super().__init__(*args, context=context, **kwargs)
 		self._ssl_sock: Optional[ssl.SSLSocket] = None
+		self._reuse_session: Optional[ssl.SSLSession] = None
 
 	@property
 	def sock(self):
@@ -40,118 +54,263 @@ class ImplicitFTP_TLS(ftplib.FTP_TLS):
 			value = self.context.wrap_socket(value, server_hostname=self.host)
 		self._ssl_sock = value
 
+	def connect(self, *args, **kwargs):
+		welcome = super().connect(*args, **kwargs)
+		# Keep an idle control channel alive between batched transfers
+		with contextlib.suppress(OSError):
+			self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+		return welcome
+
+	def prot_p(self):
+		resp = super().prot_p()
+		self._reuse_session = getattr(self.sock, "session", None)
+		return resp
+
 	def ntransfercmd(self, cmd, rest=None):
 		conn, size = ftplib.FTP.ntransfercmd(self, cmd, rest)
 		if self._prot_p:
-			session = None
-			if isinstance(self.sock, ssl.SSLSocket):
-				session = getattr(self.sock, "session", None)
+			session = self._reuse_session
+			if session is None and isinstance(self.sock, ssl.SSLSocket):
+				# TLS 1.3 tickets may arrive after PROT P; pick them up once available
+				session = self._reuse_session = self.sock.session
 			conn = self.context.wrap_socket(conn, server_hostname=self.host, session=session)
 		return conn, size
 
-	def storbinary(self, cmd, fp, blocksize=65536, callback=None, rest=None):
+	@staticmethod
+	def _can_sendfile(conn, fp) -> bool:
+		# The hook only exists where SSLSocket.sendfile can hand kTLS sockets to
+		# os.sendfile; everywhere else it degrades to small read()/send() calls.
+		uses_ktls = getattr(getattr(conn, "_sslobj", None), "uses_ktls_for_send", None)
+		if uses_ktls is None or not uses_ktls():
+			return False
+		if isinstance(fp, tempfile.SpooledTemporaryFile):
+			# fileno() would force an in-memory upload to roll over to disk
+			return False
+		try:
+			fp.fileno()
+		except (AttributeError, OSError):
+			return False
+		return True
+
+	def storbinary(self, cmd, fp, blocksize=UPLOAD_CHUNK_SIZE, callback=None, rest=None):
 		self.voidcmd("TYPE I")
+		if rest:
+			fp.seek(rest)
 		conn = self.transfercmd(cmd, rest)
 		try:
-			while True:
-				buf = fp.read(blocksize)
-				if not buf:
-					break
-				conn.sendall(buf)
-				if callback:
-					callback(len(buf))
+			readinto = getattr(fp, "readinto", None)
+			if self._can_sendfile(conn, fp):
+				# Kernel TLS: records are encrypted in-kernel, so skip the userspace copy
+				offset = fp.tell()
+				while True:
+					count = conn.sendfile(fp, offset, blocksize)
+					if not count:
+						break
+					offset += count
+					if callback:
+						callback(count)
+			elif readinto is None:
+				while True:
+					buf = fp.read(blocksize)
+					if not buf:
+						break
+					conn.sendall(buf)
+					if callback:
+						callback(len(buf))
+			else:
+				# Reuse one buffer for the whole transfer instead of a new bytes per block
+				view = memoryview(bytearray(blocksize))
+				while True:
+					count = readinto(view)
+					if not count:
+						break
+					conn.sendall(view[:count])
+					if callback:
+						callback(count)
 		finally:
 			conn.close()
 		return self.voidresp()
 
 
-def upload_file_blocking(
-	*,
+@dataclass
+class UploadJob:
+	"""A single file to STOR within a batched FTPS session."""
+
+	remote_path: str
+	local_path: Optional[str] = None
+	file_obj: Optional[BinaryIO] = None
+	file_size: Optional[int] = None
+	# Bytes already on the server; sent as REST and skipped locally
+	rest: Optional[int] = None
+
+
+@contextlib.contextmanager
+def _ftps_session(
 	host: str,
 	port: int,
 	username: str,
 	password: str,
-	remote_path: str,
-	chunk_size: int = 64 * 1024,
-	progress: ProgressCallback = None,
-	timeout: float = 30.0,
-	cancel_event: Optional[Event] = None,
-	local_path: Optional[str] = None,
-	file_obj: Optional[BinaryIO] = None,
-	file_size: Optional[int] = None,
-) -> int:
-	"""
-	Blocking FTPS upload that reuses TLS sessions for the data channel.
-	Returns total bytes sent.
-	"""
-	if not local_path and not file_obj:
-		raise ValueError("Either local_path or file_obj must be provided")
-
+	timeout: float,
+) -> Iterator[ImplicitFTP_TLS]:
+	"""Connect, log in and secure the data channel; always quit on exit."""
 	ftps = ImplicitFTP_TLS()
 	ftps.timeout = timeout
-	sent = 0
-
-	def _resolve_size() -> Optional[int]:
-		if file_size is not None:
-			return file_size
-		if local_path:
-			try:
-				return os.path.getsize(local_path)
-			except OSError:
-				return None
-		if not file_obj:
-			return None
+	try:
+		ftps.connect(host=host, port=port, timeout=timeout)
+		ftps.login(username, password)
+		ftps.prot_p()
+		yield ftps
+	finally:
+		with contextlib.suppress(Exception):
+			ftps.quit()
+
+
+def _resolve_size(job: UploadJob) -> Optional[int]:
+	if job.file_size is not None:
+		return job.file_size
+	if job.local_path:
 		try:
-			position = file_obj.tell()
-			file_obj.seek(0, os.SEEK_END)
-			size = file_obj.tell()
-			file_obj.seek(position, os.SEEK_SET)
-			return size
-		except Exception:
+			return os.path.getsize(job.local_path)
+		except OSError:
 			return None
+	if not job.file_obj:
+		return None
+	try:
+		position = job.file_obj.tell()
+		job.file_obj.seek(0, os.SEEK_END)
+		size = job.file_obj.tell()
+		job.file_obj.seek(position, os.SEEK_SET)
+		return size
+	except Exception:
+		return None
+
 
-	total_size: Optional[int] = _resolve_size()
+def _stor_one(
+	ftps: ImplicitFTP_TLS,
+	job: UploadJob,
+	*,
+	chunk_size: int,
+	on_chunk: Callable[[int, Optional[int]], None],
+) -> int:
+	"""Upload one job over an open session and return the bytes sent."""
+	if not job.local_path and not job.file_obj:
+		raise ValueError("Either local_path or file_obj must be provided")
 
-	if file_obj:
-		stream = file_obj
+	total_size = _resolve_size(job)
+	sent = job.rest or 0
+
+	if job.file_obj:
+		stream = job.file_obj
 		try:
 			stream.seek(0)
 		except Exception:
 			pass
 		should_close = False
 	else:
-		stream = open(local_path, "rb")  # noqa: PTH123
+		# Unbuffered: readinto fills our view straight from the fd, one read per block
+		stream = open(job.local_path, "rb", buffering=0)  # noqa: PTH123
 		should_close = True
 
-	def _handle_progress(written: int):
+	def _handle_chunk(written: int):
 		nonlocal sent
 		sent += written
-		if progress:
-			try:
-				progress(sent, total_size)
-			except Exception as exc:
-				logger.debug("progress callback raised: %s", exc, exc_info=True)
-				raise
-		if cancel_event and cancel_event.is_set():
-			raise UploadCancelledError("Upload cancelled by user")
+		on_chunk(sent, total_size)
 
 	try:
-		ftps.connect(host=host, port=port, timeout=timeout)
-		ftps.login(username, password)
-		ftps.prot_p()
 		ftps.storbinary(
-			f"STOR {remote_path}",
+			f"STOR {job.remote_path}",
 			stream,
 			blocksize=chunk_size,
-			callback=_handle_progress,
+			callback=_handle_chunk,
+			rest=job.rest,
 		)
 		return sent
-	except UploadCancelledError:
-		logger.info("FTPS upload cancelled by user")
-		raise
 	finally:
-		with contextlib.suppress(Exception):
-			ftps.quit()
 		if should_close:
 			with contextlib.suppress(Exception):
 				stream.close()
+
+
+def upload_files_blocking(
+	*,
+	host: str,
+	port: int,
+	username: str,
+	password: str,
+	jobs: Sequence[UploadJob],
+	chunk_size: int = UPLOAD_CHUNK_SIZE,
+	progress: BatchProgressCallback = None,
+	timeout: float = 30.0,
+	cancel_event: Optional[Event] = None,
+) -> list[int]:
+	"""
+	Upload several files over one FTPS connection, paying the TCP/TLS
+	handshake and login once. Returns the bytes sent per job.
+	"""
+	chunk_size = min(max(chunk_size, MIN_UPLOAD_CHUNK_SIZE), MAX_UPLOAD_CHUNK_SIZE)
+	total_files = len(jobs)
+	results: list[int] = []
+
+	try:
+		with _ftps_session(host, port, username, password, timeout) as ftps:
+			for index, job in enumerate(jobs):
+
+				def _on_chunk(sent: int, total: Optional[int], index: int = index):
+					if progress:
+						try:
+							progress(index, sent, total, total_files)
+						except Exception as exc:
+							logger.debug("progress callback raised: %s", exc, exc_info=True)
+							raise
+					if cancel_event and cancel_event.is_set():
+						raise UploadCancelledError("Upload cancelled by user")
+
+				results.append(_stor_one(ftps, job, chunk_size=chunk_size, on_chunk=_on_chunk))
+		return results
+	except UploadCancelledError:
+		logger.info("FTPS upload cancelled by user")
+		raise
+
+
+def upload_file_blocking(
+	*,
+	host: str,
+	port: int,
+	username: str,
+	password: str,
+	remote_path: str,
+	chunk_size: int = UPLOAD_CHUNK_SIZE,
+	progress: ProgressCallback = None,
+	timeout: float = 30.0,
+	cancel_event: Optional[Event] = None,
+	local_path: Optional[str] = None,
+	file_obj: Optional[BinaryIO] = None,
+	file_size: Optional[int] = None,
+) -> int:
+	"""
+	Blocking FTPS upload that reuses TLS sessions for the data channel.
+	Returns total bytes sent.
+	"""
+	if not local_path and not file_obj:
+		raise ValueError("Either local_path or file_obj must be provided")
+
+	def _progress(_index: int, sent: int, total: Optional[int], _total_files: int):
+		progress(sent, total)
+
+	job = UploadJob(
+		remote_path=remote_path,
+		local_path=local_path,
+		file_obj=file_obj,
+		file_size=file_size,
+	)
+	return upload_files_blocking(
+		host=host,
+		port=port,
+		username=username,
+		password=password,
+		jobs=(job,),
+		chunk_size=chunk_size,
+		progress=_progress if progress else None,
+		timeout=timeout,
+		cancel_event=cancel_event,
+	)[0]
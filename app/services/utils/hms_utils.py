@@ -8,33 +8,36 @@ HMS ve Error Code lookup helpers.
 
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+from app.core import json_codec
+
 logger = logging.getLogger(__name__)
 
 # ----------------------------------------------------------------------
 # FORMAT / NORMALIZE HELPERS
 # ----------------------------------------------------------------------
 
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 def format_timestamp(ts):
     """Convert timestamp to readable format."""
     if not ts:
         return "-"
 
     try:
-        num = int(float(ts))
+        num = int(ts) if type(ts) is int else int(float(ts))
 
         # Unix timestamp (seconds)
         if 1_000_000_000 < num < 10_000_000_000:
-            return datetime.fromtimestamp(num).strftime("%Y-%m-%d %H:%M:%S")
+            return datetime.fromtimestamp(num).strftime(_TIMESTAMP_FORMAT)
         # Milliseconds
         elif 10_000_000_000 < num < 100_000_000_000:
-            return datetime.fromtimestamp(num / 1000).strftime("%Y-%m-%d %H:%M:%S")
+            return datetime.fromtimestamp(num / 1000).strftime(_TIMESTAMP_FORMAT)
         else:
             return str(ts)
 
@@ -42,6 +45,22 @@ def format_timestamp(ts):
         return str(ts) if ts is not None else "-"
 
 
+@lru_cache(maxsize=4096)
+def _format_hex_groups(num: int) -> str:
+    if 0 <= num <= 0xFFFF:
+        return f"{num:04X}"
+    if 0 <= num <= 0xFFFFFFFF:
+        # HMS attr/code and print error values all land here
+        return f"{num >> 16:04X}-{num & 0xFFFF:04X}"
+
+    hex_str = f"{num:X}"
+    # pad to multiple of 4
+    hex_str = hex_str.zfill((len(hex_str) + 3) // 4 * 4)
+    return "-".join(
+        hex_str[i : i + 4] for i in range(0, len(hex_str), 4)
+    )
+
+
 def int_to_hex_groups(value, default: str = "-") -> str:
     """
     Convert integer to hex string in XXXX-XXXX-XXXX-XXXX format.
@@ -51,14 +70,7 @@ def int_to_hex_groups(value, default: str = "-") -> str:
         return default
 
     try:
-        num = int(value)
-        hex_str = f"{num:X}"
-
-        # pad to multiple of 4
-        hex_str = hex_str.zfill((len(hex_str) + 3) // 4 * 4)
-        return "-".join(
-            hex_str[i : i + 4] for i in range(0, len(hex_str), 4)
-        )
+        return _format_hex_groups(int(value))
 
     except (ValueError, TypeError):
         return str(value) if value is not None else default
@@ -72,17 +84,7 @@ def normalize_code(code: str) -> str:
         '03002b0000020001' -> '0300-2B00-0002-0001'
         '0a010003'         -> '0A01-0003'
     """
-    if not code:
-        return ""
-
-    cleaned = (
-        code.upper()
-        .replace("HMS_", "")
-        .replace("_", "")
-        .replace("-", "")
-        .strip()
-    )
-
+    cleaned = _normalize_lookup_code(code)
     if not cleaned:
         return ""
 
@@ -103,17 +105,17 @@ def _get_hms_data_dir() -> Path:
     return base_dir / "data" / "hms" / "data"
 
 
+_CODE_SEPARATORS = str.maketrans("", "", "_-")
+
+
+@lru_cache(maxsize=4096)
 def _normalize_lookup_code(code: str) -> str:
     if not code:
         return ""
-    return (
-        str(code)
-        .upper()
-        .replace("HMS_", "")
-        .replace("_", "")
-        .replace("-", "")
-        .strip()
-    )
+    cleaned = str(code).strip().upper()
+    if "HMS_" in cleaned:
+        cleaned = cleaned.replace("HMS_", "")
+    return cleaned.translate(_CODE_SEPARATORS).strip()
 
 
 def _device_type_from_serial(serial: Optional[str]) -> Optional[str]:
@@ -125,18 +127,21 @@ def _device_type_from_serial(serial: Optional[str]) -> Optional[str]:
     return serial[:3].upper()
 
 
-@lru_cache(maxsize=None)
-def _load_device_tables(device_type: str) -> Tuple[Dict[str, dict], Dict[str, dict]]:
-    data_dir = _get_hms_data_dir()
-    filename = f"hms_en_{device_type}.json"
-    path = data_dir / filename
-    if not path.exists():
-        logger.warning("HMS device file not found: %s", path)
-        return {}, {}
+_Tables = Tuple[Dict[str, dict], Dict[str, dict]]
+
+
+def _device_file(device_type: str) -> Path:
+    return _get_hms_data_dir() / f"hms_en_{device_type}.json"
+
 
+@lru_cache(maxsize=None)
+def _load_device_tables(device_type: str) -> Optional[_Tables]:
+    """Load HMS/error tables for ``device_type``; ``None`` if it has no data file."""
+    path = _device_file(device_type)
     try:
-        with path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
+        payload = json_codec.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
     except Exception as exc:
         logger.warning("Failed to load %s: %s", path, exc)
         return {}, {}
@@ -161,29 +166,37 @@ def _load_device_tables(device_type: str) -> Tuple[Dict[str, dict], Dict[str, di
     return _map_entries(hms_items), _map_entries(err_items)
 
 
-def _get_tables_for_serial(
-    serial: Optional[str],
-    device_type: Optional[str] = None,
-) -> Tuple[Dict[str, dict], Dict[str, dict]]:
-    data_dir = _get_hms_data_dir()
-    candidate = device_type or _device_type_from_serial(serial)
-    if candidate:
-        candidate_file = data_dir / f"hms_en_{candidate}.json"
-        if candidate_file.exists():
-            return _load_device_tables(candidate)
-    return _load_device_tables(DEFAULT_HMS_DEVICE_TYPE)
+@lru_cache(maxsize=64)
+def _tables_for_device_type(candidate: Optional[str]) -> _Tables:
+    """Tables for ``candidate``, falling back to the default device type."""
+    if candidate and candidate != DEFAULT_HMS_DEVICE_TYPE:
+        tables = _load_device_tables(candidate)
+        if tables is not None:
+            return tables
 
+    tables = _load_device_tables(DEFAULT_HMS_DEVICE_TYPE)
+    if tables is None:
+        logger.warning("HMS device file not found: %s", _device_file(DEFAULT_HMS_DEVICE_TYPE))
+        return {}, {}
+    return tables
 
-# ----------------------------------------------------------------------
-# HMS LOOKUP
-# ----------------------------------------------------------------------
 
-def resolve_hms(
+_TABLE_INDEX = {"hms": 0, "error": 1}
+
+
+@lru_cache(maxsize=2048)
+def _resolve_cached(kind: str, code: str, candidate: Optional[str]) -> Optional[dict]:
+    return _tables_for_device_type(candidate)[_TABLE_INDEX[kind]].get(code)
+
+
+def resolve(
     code: str,
+    kind: str,
     *,
     serial: Optional[str] = None,
     device_type: Optional[str] = None,
 ) -> Optional[dict]:
+    """Look up ``code`` in the ``"hms"`` or ``"error"`` table for the device."""
     if not code:
         return None
 
@@ -191,8 +204,20 @@ def resolve_hms(
     if not code:
         return None
 
-    hms_data, _ = _get_tables_for_serial(serial, device_type=device_type)
-    return hms_data.get(code)
+    return _resolve_cached(kind, code, device_type or _device_type_from_serial(serial))
+
+
+# ----------------------------------------------------------------------
+# HMS LOOKUP
+# ----------------------------------------------------------------------
+
+def resolve_hms(
+    code: str,
+    *,
+    serial: Optional[str] = None,
+    device_type: Optional[str] = None,
+) -> Optional[dict]:
+    return resolve(code, "hms", serial=serial, device_type=device_type)
 
 
 
@@ -239,15 +264,7 @@ def resolve_error(
           "description": str
         }
     """
-    if not code:
-        return None
-
-    code = _normalize_lookup_code(code)
-    if not code:
-        return None
-
-    _, err_data = _get_tables_for_serial(serial, device_type=device_type)
-    return err_data.get(code)
+    return resolve(code, "error", serial=serial, device_type=device_type)
 
 
 
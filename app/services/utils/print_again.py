@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 from typing import Any
 
 from app.models import (
@@ -11,40 +10,41 @@ from app.models import (
     PrinterState,
 )
 
-_FILENAME_SPLIT_RE = re.compile(r'[\\/]')
+_FINISHED_STATES = frozenset({PrinterGCodeState.FINISH, PrinterGCodeState.FAILED})
+# LastSentProjectFile fields copied into the payload when set, in payload order.
+_OPTIONAL_PAYLOAD_FIELDS = (
+    "bed_leveling",
+    "flow_cali",
+    "timelapse",
+    "use_ams",
+    "layer_inspect",
+    "vibration_cali",
+)
 
 
 def _extract_filename(value: str | None) -> str | None:
     if not value:
         return None
-    parts = _FILENAME_SPLIT_RE.split(str(value))
-    if not parts:
-        return None
-    candidate = parts[-1]
-    return candidate or None
+    text = str(value).replace("\\", "/")
+    return text[text.rfind("/") + 1 :] or None
 
 
 def build_print_again_payload(last_sent: LastSentProjectFile | None) -> dict[str, Any] | None:
     if not last_sent or last_sent.command != "project_file":
         return None
 
-    payload: dict[str, Any] = {
-        "url": last_sent.url,
-        "plate": last_sent.param,
-        "bed_leveling": last_sent.bed_leveling,
-        "flow_cali": last_sent.flow_cali,
-        "timelapse": last_sent.timelapse,
-        "use_ams": last_sent.use_ams,
-        "layer_inspect": last_sent.layer_inspect,
-        "vibration_cali": last_sent.vibration_cali,
-    }
-    if last_sent.ams_mapping:
-        payload["ams_mapping"] = list(last_sent.ams_mapping)
-
-    filtered = {key: value for key, value in payload.items() if value is not None}
-    if not filtered.get("url") or not filtered.get("plate"):
+    if not last_sent.url or not last_sent.param:
         return None
-    return filtered
+
+    payload: dict[str, Any] = {"url": last_sent.url, "plate": last_sent.param}
+    for key in _OPTIONAL_PAYLOAD_FIELDS:
+        value = getattr(last_sent, key)
+        if value is not None:
+            payload[key] = value
+    if last_sent.ams_mapping:
+        # The list is shared with last_sent; both are treated as read-only state.
+        payload["ams_mapping"] = last_sent.ams_mapping
+    return payload
 
 
 def evaluate_print_again_state(
@@ -52,11 +52,7 @@ def evaluate_print_again_state(
     last_sent: LastSentProjectFile | None,
     online: bool,
 ) -> PrintAgainState:
-    finished_states = {
-        PrinterGCodeState.FINISH,
-        PrinterGCodeState.FAILED,
-    }
-    if print_status.gcode_state not in finished_states:
+    if print_status.gcode_state not in _FINISHED_STATES:
         return PrintAgainState(reason="print_in_progress")
 
     payload = build_print_again_payload(last_sent)
@@ -2,19 +2,41 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 from pathlib import Path
 
+from app.core import json_codec
+
+# Bump when the meta digest layout changes; older sidecars then read as stale.
+_META_VERSION = b"1"
+
+
+def _digest(*parts: str) -> bytes:
+    data = "\x00".join(map(str, parts)).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=8).hexdigest().encode("ascii")
+
+
+def _meta_prefix(filename: str, modified: str, size: str) -> bytes:
+    return _META_VERSION + _digest(modified, size, filename)
+
+
+# The sidecar stays a JSON object readable by other meta consumers; ``digest`` is
+# written first so ``is_valid`` can compare raw bytes without parsing.
+_DIGEST_HEAD = b'{"digest":"'
+
 
 class PrintJobCache:
     """Manage cached print job files and metadata on disk."""
 
     def __init__(self, base_dir: Path) -> None:
         self._base_dir = base_dir
+        self._ensured_dirs: set[str] = set()
 
     def get_paths(self, printer_id: str, filename: str) -> tuple[Path, Path]:
         base = self._base_dir / printer_id
-        base.mkdir(parents=True, exist_ok=True)
+        if printer_id not in self._ensured_dirs:
+            base.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(printer_id)
         return base / filename, base / f"{filename}.meta.json"
 
     async def is_valid(
@@ -27,24 +49,17 @@ class PrintJobCache:
     ) -> bool:
         file_path, meta_path = self.get_paths(printer_id, filename)
 
-        if not file_path.exists() or not meta_path.exists():
-            return False
-
         try:
-            meta = json.loads(meta_path.read_text())
+            file_path.stat()
+            meta = meta_path.read_bytes()
         except Exception:
             return False
 
-        if meta.get("modified") != modified:
-            return False
-        if meta.get("size") != size:
-            return False
-        if meta.get("name") != filename:
-            return False
-        if remote_path and meta.get("path") != remote_path:
-            return False
-
-        return True
+        head = _DIGEST_HEAD + _meta_prefix(filename, modified, size)
+        if not remote_path:
+            # Without a remote path only the file identity half is compared
+            return meta.startswith(head)
+        return meta.startswith(head + _digest(remote_path) + b'"')
 
     async def write_meta(
         self,
@@ -55,11 +70,23 @@ class PrintJobCache:
         remote_path: str,
     ) -> None:
         _, meta_path = self.get_paths(printer_id, filename)
-        meta = {
-            "name": filename,
-            "modified": modified,
-            "size": size,
-            "path": remote_path,
-        }
-        meta_json = json.dumps(meta)
-        await asyncio.to_thread(meta_path.write_text, meta_json)
+        digest = _meta_prefix(filename, modified, size) + _digest(remote_path)
+        payload = json_codec.dumps(
+            {
+                "digest": digest.decode("ascii"),
+                "name": filename,
+                "modified": modified,
+                "size": size,
+                "path": remote_path,
+            }
+        )
+
+        def _write() -> None:
+            try:
+                if meta_path.read_bytes() == payload:
+                    return
+            except OSError:
+                pass
+            meta_path.write_bytes(payload)
+
+        await asyncio.to_thread(_write)
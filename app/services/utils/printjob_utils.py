@@ -1,12 +1,39 @@
 ﻿"""Print job parsing helpers."""
 import logging
 import re
+import sys
+from itertools import islice
 import xml.etree.ElementTree as ET
 from pathlib import Path
+from typing import Iterator
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_top_level(config_path: Path, tag: str) -> Iterator[ET.Element]:
+    """Stream the root's direct ``tag`` children, clearing each one once handled."""
+    depth = 0
+    for event, element in ET.iterparse(config_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1:
+            continue
+        if element.tag == tag:
+            yield element
+        element.clear()
+
+
+def _to_int(value: str | None, default: int | None) -> int | None:
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 def parse_slice_metadata(printer_id: str, extract_dir: Path) -> dict:
     """Parse Metadata/slice_info.config for plate and filament details."""
     config_path = extract_dir / "Metadata" / "slice_info.config"
@@ -17,10 +44,9 @@ def parse_slice_metadata(printer_id: str, extract_dir: Path) -> dict:
         return result
 
     try:
-        tree = ET.parse(config_path)
-        root = tree.getroot()
-
-        for plate_el in root.findall("plate"):
+        # Plates are collected separately so a parse error midway still yields no plates
+        plates = []
+        for plate_el in _iter_top_level(config_path, "plate"):
             plate_meta: dict[str, str] = {}
             for meta_el in plate_el.findall("metadata"):
                 key = meta_el.get("key")
@@ -28,41 +54,40 @@ def parse_slice_metadata(printer_id: str, extract_dir: Path) -> dict:
                 if key:
                     plate_meta[key] = value
 
+            # Enum-like attribute values repeat across plates and cached jobs; intern them
             filaments = []
             for fil_el in plate_el.findall("filament"):
+                attrs = fil_el.attrib
                 filaments.append(
                     {
-                        "id": int(fil_el.get("id", "0")),
-                        "tray_info_idx": fil_el.get("tray_info_idx") or "",
-                        "type": fil_el.get("type") or "",
-                        "color": fil_el.get("color") or "",
-                        "used_m": float(fil_el.get("used_m", "0") or 0),
-                        "used_g": float(fil_el.get("used_g", "0") or 0),
+                        "id": _to_int(attrs.get("id"), 0),
+                        "tray_info_idx": sys.intern(attrs.get("tray_info_idx") or ""),
+                        "type": sys.intern(attrs.get("type") or ""),
+                        "color": sys.intern(attrs.get("color") or ""),
+                        "used_m": float(attrs.get("used_m") or 0),
+                        "used_g": float(attrs.get("used_g") or 0),
                     }
                 )
 
             warnings = []
             for warn_el in plate_el.findall("warning"):
+                attrs = warn_el.attrib
                 warnings.append(
                     {
-                        "msg": warn_el.get("msg") or "",
-                        "level": warn_el.get("level") or "",
-                        "error_code": warn_el.get("error_code") or "",
+                        "msg": attrs.get("msg") or "",
+                        "level": sys.intern(attrs.get("level") or ""),
+                        "error_code": attrs.get("error_code") or "",
                     }
                 )
 
             objects = []
             for obj_el in plate_el.findall("object"):
-                identify_id = obj_el.get("identify_id")
-                try:
-                    identify_id_int = int(identify_id) if identify_id is not None else None
-                except ValueError:
-                    identify_id_int = None
-                skipped_raw = (obj_el.get("skipped") or "").strip().lower()
+                attrs = obj_el.attrib
+                skipped_raw = (attrs.get("skipped") or "").strip().lower()
                 objects.append(
                     {
-                        "identify_id": identify_id_int,
-                        "name": obj_el.get("name") or "",
+                        "identify_id": _to_int(attrs.get("identify_id"), None),
+                        "name": attrs.get("name") or "",
                         "skipped": skipped_raw == "true",
                     }
                 )
@@ -73,7 +98,7 @@ def parse_slice_metadata(printer_id: str, extract_dir: Path) -> dict:
             except ValueError:
                 index_int = None
 
-            result["plates"].append(
+            plates.append(
                 {
                     "index": index_int,
                     "metadata": plate_meta,
@@ -83,6 +108,7 @@ def parse_slice_metadata(printer_id: str, extract_dir: Path) -> dict:
                 }
             )
 
+        result["plates"] = plates
         return result
 
     except Exception as exc:
@@ -90,6 +116,33 @@ def parse_slice_metadata(printer_id: str, extract_dir: Path) -> dict:
         return result
 
 
+_TIME_RE = re.compile(r"(?:(\d+)h)?\s*(?:(\d+)m)?\s*(?:(\d+)s)?")
+_HEADER_BLOCK_RE = re.compile(
+    r"^[^\n]*HEADER_BLOCK_START[^\n]*\n(.*?)(?:^[^\n]*HEADER_BLOCK_END|\Z)",
+    re.S | re.M,
+)
+_HEADER_LINE_RE = re.compile(
+    r"^[ \t]*;+[ \t]*((?:model printing time:|total layer number:|total filament weight)[^\n]*)",
+    re.M,
+)
+_FILAMENT_LINE_RE = re.compile(
+    r"^[ \t]*; (filament_ids|filament_settings_id)[^=\n]*=([^\n]*)",
+    re.M,
+)
+_QUOTED_RE = re.compile(r'"([^\"]+)"')
+_GCODE_HEADER_MAX_LINES = 300
+
+
+def _parse_time_to_seconds(text: str) -> int | None:
+    m = _TIME_RE.search(text)
+    if not m:
+        return None
+    h = int(m.group(1) or 0)
+    m_ = int(m.group(2) or 0)
+    s = int(m.group(3) or 0)
+    return h * 3600 + m_ * 60 + s
+
+
 def parse_gcode_header(printer_id: str, plate_path: Path) -> dict:
     """Parse HEADER_BLOCK and filament lines in the plate gcode."""
     summary: dict = {
@@ -105,44 +158,18 @@ def parse_gcode_header(printer_id: str, plate_path: Path) -> dict:
         logger.warning("Plate gcode file does not exist: %s", plate_path)
         return summary
 
-    def _parse_time_to_seconds(text: str) -> int | None:
-        pattern = r"(?:(\d+)h)?\s*(?:(\d+)m)?\s*(?:(\d+)s)?"
-        m = re.search(pattern, text)
-        if not m:
-            return None
-        h = int(m.group(1) or 0)
-        m_ = int(m.group(2) or 0)
-        s = int(m.group(3) or 0)
-        return h * 3600 + m_ * 60 + s
-
     try:
         with plate_path.open("r", encoding="utf-8", errors="ignore") as f:
-            lines = []
-            for _ in range(300):
-                line = f.readline()
-                if not line:
-                    break
-                lines.append(line.rstrip("\n"))
-
-        in_header = False
-        for line in lines:
-            stripped = line.strip()
-
-            if "HEADER_BLOCK_START" in stripped:
-                in_header = True
-                continue
-            if "HEADER_BLOCK_END" in stripped:
-                in_header = False
-                continue
-
-            if in_header and stripped.startswith(";"):
-                content = stripped.lstrip(";").strip()
+            text = "".join(islice(f, _GCODE_HEADER_MAX_LINES))
+
+        for block in _HEADER_BLOCK_RE.finditer(text):
+            for line in _HEADER_LINE_RE.finditer(block.group(1)):
+                content = line.group(1).strip()
 
                 if content.startswith("model printing time:"):
                     parts = content.split(";")
-                    if len(parts) >= 1 and "model printing time:" in parts[0]:
-                        t_text = parts[0].split("model printing time:")[-1].strip()
-                        summary["model_printing_time_s"] = _parse_time_to_seconds(t_text)
+                    t_text = parts[0].split("model printing time:")[-1].strip()
+                    summary["model_printing_time_s"] = _parse_time_to_seconds(t_text)
                     if len(parts) >= 2 and "total estimated time:" in parts[1]:
                         t_text = parts[1].split("total estimated time:")[-1].strip()
                         summary["estimated_time_s"] = _parse_time_to_seconds(t_text)
@@ -154,32 +181,23 @@ def parse_gcode_header(printer_id: str, plate_path: Path) -> dict:
                     except ValueError:
                         pass
 
-                elif content.startswith("total filament weight"):
+                else:
                     try:
                         value = content.split(":")[-1].strip()
                         summary["total_filament_weight_g"] = float(value)
                     except ValueError:
                         pass
 
-            if stripped.startswith("; filament_ids"):
-                try:
-                    value = stripped.split("=", 1)[1].strip()
-                    summary["filament_ids"] = [
-                        part.strip() for part in value.split(";") if part.strip()
-                    ]
-                except Exception:
-                    pass
-
-            if stripped.startswith("; filament_settings_id"):
-                try:
-                    value = stripped.split("=", 1)[1].strip()
-                    raw = value.strip()
-                    if raw.startswith(";"):
-                        raw = raw[1:].strip()
-                    matches = re.findall(r'"([^\"]+)"', raw)
-                    summary["filament_settings"] = matches
-                except Exception:
-                    pass
+        for line in _FILAMENT_LINE_RE.finditer(text):
+            value = line.group(2).strip()
+            if line.group(1) == "filament_ids":
+                summary["filament_ids"] = [
+                    part.strip() for part in value.split(";") if part.strip()
+                ]
+            else:
+                if value.startswith(";"):
+                    value = value[1:].strip()
+                summary["filament_settings"] = _QUOTED_RE.findall(value)
 
         return summary
 
@@ -210,10 +228,8 @@ def parse_model_settings(printer_id: str, extract_dir: Path) -> dict:
         return result
 
     try:
-        tree = ET.parse(config_path)
-        root = tree.getroot()
-
-        for plate_el in root.findall("plate"):
+        plates = []
+        for plate_el in _iter_top_level(config_path, "plate"):
             plate_meta: dict[str, str] = {}
             for meta_el in plate_el.findall("metadata"):
                 key = meta_el.get("key")
@@ -227,13 +243,14 @@ def parse_model_settings(printer_id: str, extract_dir: Path) -> dict:
             except ValueError:
                 index_int = None
 
-            result["plates"].append(
+            plates.append(
                 {
                     "index": index_int,
                     "metadata": plate_meta,
                 }
             )
 
+        result["plates"] = plates
         return result
 
     except Exception as exc:
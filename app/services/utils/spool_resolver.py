@@ -6,12 +6,32 @@ from typing import Any, Dict
 from app.models import ExternalSpool, PrinterState
 
 
+def _to_int(value: Any, default: int = 0) -> int:
+    try:
+        if isinstance(value, (str, bytes)) and not str(value).strip():
+            return default
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _pick(data: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+    """Return the first truthy value among ``keys``, mirroring an ``or`` chain."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
 class SpoolResolver:
     """Attach VT tray metadata to the printer state."""
 
     def attach_external_spool(self, state: PrinterState, master_data: Dict[str, Any]) -> None:
         spool_data = self._locate_vt_tray(master_data)
         external_spool = self._build_external_spool(spool_data)
+        if state.ams.external_spool == external_spool:
+            return
         state.ams = state.ams.copy(update={"external_spool": external_spool})
 
     def _locate_vt_tray(self, master_data: Dict[str, Any]) -> dict[str, Any] | None:
@@ -31,30 +51,15 @@ class SpoolResolver:
         if not vt_data:
             return None
 
-        def to_int(value: Any, default: int = 0) -> int:
-            try:
-                if isinstance(value, (str, bytes)) and not str(value).strip():
-                    return default
-                return int(float(value))
-            except (TypeError, ValueError):
-                return default
-
-        record_id = vt_data.get("id") or vt_data.get("tray_id") or vt_data.get("tray_id_name") or "?"
-        tray_type = vt_data.get("tray_type") or vt_data.get("tray_info_idx") or "External Spool"
-        color = vt_data.get("tray_color") or vt_data.get("color") or "000000FF"
+        tray_type = str(_pick(vt_data, "tray_type", "tray_info_idx", default="External Spool"))
 
         return ExternalSpool(
-            id=str(record_id),
-            material=str(tray_type),
-            remain=to_int(vt_data.get("remain")),
-            color=str(color),
+            id=str(_pick(vt_data, "id", "tray_id", "tray_id_name", default="?")),
+            material=tray_type,
+            remain=_to_int(vt_data.get("remain")),
+            color=str(_pick(vt_data, "tray_color", "color", default="000000FF")),
             nozzle_min=str(vt_data.get("nozzle_temp_min", vt_data.get("nozzle_min", "?"))),
             nozzle_max=str(vt_data.get("nozzle_temp_max", vt_data.get("nozzle_max", "?"))),
-            tray_type=str(tray_type),
-            tray_info_idx=str(
-                vt_data.get("tray_info_idx")
-                or vt_data.get("tray_id_name")
-                or vt_data.get("filament_id")
-                or ""
-            ),
+            tray_type=tray_type,
+            tray_info_idx=str(_pick(vt_data, "tray_info_idx", "tray_id_name", "filament_id", default="")),
         )
@@ -38,21 +38,29 @@ def parse_slot_int(value: Any) -> Optional[int]:
         raw = value.strip()
         if not raw:
             return None
-        base = 10
-        if any(ch in "abcdefABCDEF" for ch in raw):
-            base = 16
+        # Decimal is the common case; only strings with hex letters are base 16
         try:
-            return int(raw, base)
+            return int(raw)
         except ValueError:
+            if not any(ch in "abcdefABCDEF" for ch in raw):
+                return None
             try:
-                return int(raw)
+                return int(raw, 16)
             except ValueError:
                 return None
     return None
 
 
+# Decoded slot flags for every 4-bit mask, the layout used by a single AMS unit.
+_FOUR_SLOT_BITS = tuple(
+    tuple(bool((mask >> idx) & 1) for idx in range(4)) for mask in range(16)
+)
+
+
 def decode_tray_bits(bits_value: Any, slot_count: int = 4) -> List[bool]:
     parsed = parse_slot_int(bits_value)
     if parsed is None:
         return []
+    if slot_count == 4:
+        return list(_FOUR_SLOT_BITS[parsed & 0xF])
     return [bool((parsed >> idx) & 1) for idx in range(slot_count)]
@@ -2,23 +2,32 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Iterable
 
 
 class TaskQueue:
-    def __init__(self, *, name: str, concurrency: int = 1) -> None:
+    def __init__(self, *, name: str, concurrency: int = 1, max_batch: int = 1) -> None:
         self._name = name
         self._concurrency = max(1, concurrency)
+        # Each worker drains up to this many queued jobs per wakeup and runs them together
+        self._max_batch = max(1, max_batch)
         self._queue: asyncio.Queue[tuple[Callable[[], Awaitable], asyncio.Future]] = asyncio.Queue()
         self._workers: list[asyncio.Task] = []
         self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Result future -> running task, so one bound callback serves every job
+        self._pending: dict[asyncio.Future, asyncio.Task] = {}
+        self._on_future_done = self._cancel_pending
 
     async def start(self) -> None:
         if self._running:
             return
         self._running = True
+        # Workers and submitters share this loop; cached so submit skips the lookup
+        self._loop = asyncio.get_running_loop()
+        worker = self._worker if self._max_batch == 1 else self._batch_worker
         self._workers = [
-            asyncio.create_task(self._worker(), name=f"{self._name}-worker-{idx}")
+            asyncio.create_task(worker(), name=f"{self._name}-worker-{idx}")
             for idx in range(self._concurrency)
         ]
 
@@ -34,11 +43,16 @@ class TaskQueue:
     async def submit(self, coro_fn: Callable[[], Awaitable]) -> asyncio.Future:
         if not self._running:
             await self.start()
-        loop = asyncio.get_running_loop()
+        loop = self._loop
+        if loop.get_debug():
+            assert asyncio.get_running_loop() is loop, "TaskQueue used from a different event loop"
         future: asyncio.Future = loop.create_future()
         await self._queue.put((coro_fn, future))
         return future
 
+    async def submit_many(self, coro_fns: Iterable[Callable[[], Awaitable]]) -> list[asyncio.Future]:
+        return [await self.submit(coro_fn) for coro_fn in coro_fns]
+
     async def _worker(self) -> None:
         while True:
             coro_fn, future = await self._queue.get()
@@ -46,12 +60,8 @@ class TaskQueue:
                 self._queue.task_done()
                 continue
             task = asyncio.create_task(coro_fn())
-
-            def _cancel_task(fut: asyncio.Future) -> None:
-                if fut.cancelled() and not task.done():
-                    task.cancel()
-
-            future.add_done_callback(_cancel_task)
+            self._pending[future] = task
+            future.add_done_callback(self._on_future_done)
 
             try:
                 result = await task
@@ -65,4 +75,47 @@ class TaskQueue:
                 if not future.done():
                     future.set_result(result)
             finally:
+                self._pending.pop(future, None)
                 self._queue.task_done()
+
+    async def _batch_worker(self) -> None:
+        while True:
+            items = [await self._queue.get()]
+            while len(items) < self._max_batch and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+
+            live = [(coro_fn, future) for coro_fn, future in items if not future.cancelled()]
+            tasks = []
+            for coro_fn, future in live:
+                task = asyncio.create_task(coro_fn())
+                self._pending[future] = task
+                future.add_done_callback(self._on_future_done)
+                tasks.append(task)
+
+            try:
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+            except asyncio.CancelledError:
+                for _, future in live:
+                    if not future.done():
+                        future.cancel()
+                raise
+            else:
+                for (_, future), result in zip(live, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, asyncio.CancelledError):
+                        future.cancel()
+                    elif isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+            finally:
+                for _, future in live:
+                    self._pending.pop(future, None)
+                for _ in items:
+                    self._queue.task_done()
+
+    def _cancel_pending(self, future: asyncio.Future) -> None:
+        task = self._pending.pop(future, None)
+        if task is not None and future.cancelled() and not task.done():
+            task.cancel()
@@ -4,101 +4,69 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
 
+from app.api.dependencies import get_optional_service_registry
+from app.core import json_codec
 from app.core.config import get_app_config, is_password_setup_required, is_setup_required
 from app.services.registry import ServiceRegistry
 
 BASE_DIR = Path(__file__).resolve().parent
 TEMPLATES = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Templates ship with the app; skip the per-render mtime check and keep every compiled template.
+TEMPLATES.env.auto_reload = False
+TEMPLATES.env.cache_size = -1
 
-DEFAULT_UI_STATE: Dict[str, Any] = {
-    "statusPanel": {
-        "activeTab": "status",
-        "selectedSlot": None,
-        "chamberLight": {"base": "off", "pending": None, "expiresAt": 0},
-        "featureTogglePending": {},
-        "lastDisplayedPrintErrorCode": None,
-        "lastAcknowledgedPrintErrorCode": None,
-    },
-    "controls": {
-        "activeTab": "movement",
-        "lastActiveTab": "movement",
-        "chamberLight": {"base": "off", "pending": None, "expiresAt": 0},
-        "speedLevel": {"base": 0, "pending": None, "expiresAt": 0},
-    },
-    "printerSelector": {
-        "printers": [],
-        "selectedId": None,
-        "pendingId": None,
-        "isSwitching": False,
-        "isRefreshing": False,
-        "isAdding": False,
-        "userCollapsed": True,
-        "refreshIntervalMs": 5000,
-        "apiRetryScheduled": False,
-        "lastEmittedSelectionId": None,
-        "openStatusDetailId": None,
-        "printerUnreadMap": {},
-        "isSetupMode": False,
-        "isVerified": False,
-        "verificationPayloadHash": None,
-        "isEditing": False,
-        "editingPrinterId": None,
-        "modalMode": "add",
-        "modalSecondaryAction": "close",
-        "editingPrinterAccessCode": "",
-        "initialPayload": None,
-        "canApplyWithoutVerify": False,
-    },
-    "fileExplorer": {
-        "currentPath": "/",
-        "activeFile": None,
-        "isContextMenuOpen": False,
-        "isLoading": False,
-        "lastError": None,
-        "files": [],
-    },
-    "printSetup": {
-        "metadata": None,
-        "currentPlateIndex": 0,
-        "amsMapping": [],
-        "currentTrayMeta": [],
-        "currentFilamentGroups": [],
-        "typeMismatchMessages": [],
-        "nozzleWarningText": "",
-        "nozzleMismatch": False,
-        "plateMappings": {},
-        "plateFiles": [],
-        "plateFilamentIds": [],
-        "maxFilamentId": 0,
-        "platePreviewUrls": [],
-        "externalSlotValue": -2,
-        "externalFocusIndex": None,
-        "pendingFileURL": None,
-    },
-}
+_DASHBOARD_TEMPLATE = TEMPLATES.env.get_template("dashboard.html")
+_LOGIN_TEMPLATE = TEMPLATES.env.get_template("login.html")
+_SETUP_TEMPLATE = TEMPLATES.env.get_template("setup.html")
+_DEBUG_TEMPLATE = TEMPLATES.env.get_template("debug.html")
+_NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+
+# Initial frontend UI state; kept as JSON so it can be edited alongside the static assets.
+DEFAULT_UI_STATE: Dict[str, Any] = json_codec.loads(
+    (BASE_DIR / "static" / "default_ui_state.json").read_bytes()
+)
+
+
+def _json_text(obj: Any) -> str:
+    return json_codec.dumps(obj).decode("utf-8")
+
+
+# The UI defaults never change, so they are serialized once and spliced into every page.
+_DEFAULT_UI_STATE_JSON = htmlsafe_json_dumps(DEFAULT_UI_STATE, dumps=_json_text)
 
 router = APIRouter()
 
 
+def _render_no_store(template, **context: Any) -> HTMLResponse:
+    return HTMLResponse(template.render(**context), headers=_NO_STORE_HEADERS)
+
+
+def _initial_data_json(initial_data: Optional[Dict[str, Any]]) -> Markup:
+    if initial_data is None:
+        return Markup("null")
+    dynamic = htmlsafe_json_dumps(initial_data, dumps=_json_text)
+    return Markup(f'{dynamic[:-1]},"ui":{_DEFAULT_UI_STATE_JSON}}}')
+
+
 def _is_logged_in(request: Request) -> bool:
     session = getattr(request, "session", {}) or {}
     return bool(session.get("admin_logged_in"))
 
 
-async def _collect_initial_data(request: Request) -> Optional[Dict[str, Any]]:
-    services: ServiceRegistry | None = getattr(request.app.state, "services", None)
+async def _collect_initial_data(services: ServiceRegistry | None) -> Optional[Dict[str, Any]]:
     if not services:
         return None
     printer_id = services.state_manager.get_active_printer_id() or services.settings.printer_id
     if not printer_id:
         return None
 
-    state = await services.state_manager.get_state(printer_id)
-    master_data = await services.state_manager.get_master_data(printer_id)
+    state, master_data = await services.state_manager.get_state_bundle(printer_id)
 
     printer_info = master_data.get("printer")
     if not printer_info:
@@ -121,12 +89,14 @@ async def _collect_initial_data(request: Request) -> Optional[Dict[str, Any]]:
         "capabilities": capabilities,
         "ams": ams,
         "externalSpool": external_spool,
-        "ui": DEFAULT_UI_STATE,
     }
 
 
 @router.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request) -> HTMLResponse:
+async def dashboard(
+    request: Request,
+    services: ServiceRegistry | None = Depends(get_optional_service_registry),
+) -> HTMLResponse:
     """Render the main dashboard page."""
 
     if is_setup_required():
@@ -134,18 +104,14 @@ async def dashboard(request: Request) -> HTMLResponse:
     if not _is_logged_in(request):
         return RedirectResponse("/login")
     app_config = get_app_config()
-    initial_data = await _collect_initial_data(request)
-    response = TEMPLATES.TemplateResponse(
-        "dashboard.html",
-        {
-            "request": request,
-            "first_run": False,
-            "initial_data": initial_data,
-            "api_token": app_config.api_token,
-        },
+    initial_data = await _collect_initial_data(services)
+    return _render_no_store(
+        _DASHBOARD_TEMPLATE,
+        request=request,
+        first_run=False,
+        initial_data_json=_initial_data_json(initial_data),
+        api_token=app_config.api_token,
     )
-    response.headers["Cache-Control"] = "no-store"
-    return response
 
 
 @router.get("/login", response_class=HTMLResponse)
@@ -156,37 +122,31 @@ async def login_view(request: Request) -> HTMLResponse:
         return RedirectResponse("/setup")
     if _is_logged_in(request):
         return RedirectResponse("/")
-    response = TEMPLATES.TemplateResponse(
-        "login.html",
-        {"request": request},
-    )
-    response.headers["Cache-Control"] = "no-store"
-    return response
+    return _render_no_store(_LOGIN_TEMPLATE, request=request)
 
 
 @router.get("/setup", response_class=HTMLResponse)
-async def setup_wizard(request: Request) -> HTMLResponse:
+async def setup_wizard(
+    request: Request,
+    services: ServiceRegistry | None = Depends(get_optional_service_registry),
+) -> HTMLResponse:
     """Render the dashboard preloaded with the add-printer modal."""
 
     if not is_setup_required():
         return RedirectResponse("/")
     app_config = get_app_config()
-    initial_data = await _collect_initial_data(request)
+    initial_data = await _collect_initial_data(services)
     password_required = is_password_setup_required()
     setup_step = "password" if password_required else "printer"
-    response = TEMPLATES.TemplateResponse(
-        "setup.html",
-        {
-            "request": request,
-            "first_run": True,
-            "initial_data": initial_data,
-            "api_token": app_config.api_token,
-            "setup_step": setup_step,
-            "password_required": password_required,
-        },
+    return _render_no_store(
+        _SETUP_TEMPLATE,
+        request=request,
+        first_run=True,
+        initial_data_json=_initial_data_json(initial_data),
+        api_token=app_config.api_token,
+        setup_step=setup_step,
+        password_required=password_required,
     )
-    response.headers["Cache-Control"] = "no-store"
-    return response
 
 
 @router.get("/debug", response_class=HTMLResponse)
@@ -198,7 +158,4 @@ async def debug_console(request: Request) -> HTMLResponse:
     if not _is_logged_in(request):
         return RedirectResponse("/login")
     app_config = get_app_config()
-    return TEMPLATES.TemplateResponse(
-        "debug.html",
-        {"request": request, "api_token": app_config.api_token},
-    )
+    return HTMLResponse(_DEBUG_TEMPLATE.render(request=request, api_token=app_config.api_token))
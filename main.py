@@ -8,8 +8,17 @@ if sys.platform == "win32":
     # Selector loop is needed on Windows so aiomqtt can register readers/writers.
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
+try:
+    # uvloop (shipped with uvicorn[standard] on POSIX) also implements add_reader/add_writer.
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
 def selector_loop_factory(use_subprocess: bool = False) -> asyncio.AbstractEventLoop:
-    """Always use the selector loop so add_reader/add_writer stay available."""
+    """Use a loop with add_reader/add_writer: uvloop on POSIX when installed, else the selector loop."""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.new_event_loop()
     return asyncio.SelectorEventLoop()
 
 import uvicorn
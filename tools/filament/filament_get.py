@@ -1,7 +1,13 @@
 import json
+import re
 from pathlib import Path
 from urllib.request import urlopen
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib
+    orjson = None
+
 # --------------------------------------------------
 # PATHS
 # tools/filament/filament_get.py -> project root
@@ -34,13 +40,31 @@ MATERIAL_MAP = {
     "PPS-CF": "PPS",
 }
 
+_MATERIAL_ORDER = {key: idx for idx, key in enumerate(MATERIAL_MAP)}
+# Zero-width lookahead reports every key occurrence (even overlapping ones) in one scan;
+# no key is a prefix of another, so each position matches at most one key.
+_MATERIAL_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(MATERIAL_MAP, key=len, reverse=True)) + "))"
+)
+
 
 # --------------------------------------------------
 # HELPERS
 # --------------------------------------------------
+def load_json(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def write_json(path: Path, obj) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
 def fetch_json(url: str) -> dict:
     with urlopen(url) as r:
-        return json.loads(r.read().decode("utf-8"))
+        return load_json(r.read())
 
 
 def infer_material(text: str) -> str:
@@ -48,11 +72,11 @@ def infer_material(text: str) -> str:
     if "Support" in text or "PVA" in text:
         return "SUPPORT"
 
-    for key, value in MATERIAL_MAP.items():
-        if key in text:
-            return value
-
-    return "OTHER"
+    found = [m.group(1) for m in _MATERIAL_RE.finditer(text)]
+    if not found:
+        return "OTHER"
+    # MATERIAL_MAP order decides between several matches, as before
+    return MATERIAL_MAP[min(found, key=_MATERIAL_ORDER.__getitem__)]
 
 
 def clean_name(display_name: str, material: str) -> str:
@@ -109,8 +133,7 @@ def build():
     for v in merged.values():
         v["colors"] = sorted(set(v["colors"]))
 
-    with open(OUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(merged, f, indent=2, ensure_ascii=False)
+    write_json(OUT_FILE, merged)
 
     print(f"OK -> {OUT_FILE} ({len(merged)} items)")
 
@@ -1,12 +1,18 @@
 import json
 import re
-import io
 import zipfile
-import shutil
+import tempfile
 import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib.request import urlopen, Request
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib
+    orjson = None
+
 # ==================================================
 # PATHS
 # ==================================================
@@ -18,126 +24,190 @@ DATA_DIR.mkdir(parents=True, exist_ok=True)
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 OUT_FILE = DATA_DIR / "filaments_full.json"
+# Profile reads are many small files; threads only overlap the file I/O (parsing holds the GIL)
+LOAD_WORKERS = 16
 VERSION_FILE = CACHE_DIR / ".repo_version"
 
 # ==================================================
 # SOURCE
 # ==================================================
 ZIP_URL = "https://github.com/bambulab/BambuStudio/archive/refs/heads/master.zip"
+HEAD_COMMIT_URL = "https://api.github.com/repos/bambulab/BambuStudio/commits/master"
 FILAMENT_PATH = "resources/profiles/BBL/filament/"
+DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
 # ==================================================
 # HELPERS
 # ==================================================
-def compute_sha256(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
-
-
-def extract_setting_id(obj):
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k in ("setting_id", "filament_settings_id") and isinstance(v, str):
-                return v
-            r = extract_setting_id(v)
-            if r:
-                return r
-    elif isinstance(obj, list):
-        for v in obj:
-            r = extract_setting_id(v)
-            if r:
-                return r
-    return None
-
-
-def extract_nozzle_range(obj):
-    low, high = None, None
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k == "nozzle_temperature_range_low":
-                low = int(v[0]) if isinstance(v, list) else int(v)
-            elif k == "nozzle_temperature_range_high":
-                high = int(v[0]) if isinstance(v, list) else int(v)
-            else:
-                r_low, r_high = extract_nozzle_range(v)
-                low = low or r_low
-                high = high or r_high
-    elif isinstance(obj, list):
-        for v in obj:
-            r_low, r_high = extract_nozzle_range(v)
-            low = low or r_low
-            high = high or r_high
-    return low, high
+def load_json(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def write_json(path: Path, obj) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def download_with_sha256(src, dst) -> str:
+    """Copy ``src`` to ``dst`` chunk by chunk, hashing each chunk as it is written.
+
+    The digest comes from the same pass as the copy, so the file is never re-read.
+    """
+    h = hashlib.sha256()
+    while chunk := src.read(DOWNLOAD_CHUNK_SIZE):
+        h.update(chunk)
+        dst.write(chunk)
+    return h.hexdigest()
+
+
+_SETTING_ID_KEYS = ("setting_id", "filament_settings_id")
+
+
+def _first_int(value):
+    return int(value[0]) if isinstance(value, list) else int(value)
+
+
+def extract_profile_fields(obj):
+    """Return (setting_id, nozzle_min, nozzle_max) from a single breadth-first walk."""
+    setting_id, low, high = None, None, None
+    queue = deque((obj,))
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if k in _SETTING_ID_KEYS and isinstance(v, str):
+                    if setting_id is None:
+                        setting_id = v
+                elif k == "nozzle_temperature_range_low":
+                    if low is None:
+                        low = _first_int(v)
+                elif k == "nozzle_temperature_range_high":
+                    if high is None:
+                        high = _first_int(v)
+                elif isinstance(v, (dict, list)):
+                    queue.append(v)
+        elif isinstance(node, list):
+            queue.extend(v for v in node if isinstance(v, (dict, list)))
+        if setting_id is not None and low is not None and high is not None:
+            break
+    return setting_id, low, high
+
+
+def load_profile(path: Path):
+    try:
+        data = load_json(path.read_bytes())
+        return data.get("name"), data
+    except Exception as e:
+        print(f"[WARN] Failed to load {path.name}: {e}")
+        return None
+
+
+def profile_fields(resolved):
+    """Like extract_profile_fields, reading the usual top-level keys directly."""
+    setting_id = resolved.get("setting_id")
+    if not isinstance(setting_id, str):
+        setting_id = resolved.get("filament_settings_id")
+    low = resolved.get("nozzle_temperature_range_low")
+    high = resolved.get("nozzle_temperature_range_high")
+    if not isinstance(setting_id, str) or low is None or high is None:
+        return extract_profile_fields(resolved)
+    return setting_id, _first_int(low), _first_int(high)
 
 
 # ==================================================
 # GITHUB CACHE
 # ==================================================
-def ensure_cache():
-    print("[INFO] Checking GitHub ZIP content hash...")
-
-    with urlopen(ZIP_URL, timeout=60) as r:
-        zip_bytes = r.read()
-
-    remote_hash = compute_sha256(zip_bytes)
-    local_hash = VERSION_FILE.read_text().strip() if VERSION_FILE.exists() else None
+def fetch_head_sha():
+    req = Request(HEAD_COMMIT_URL, headers={"User-Agent": "bambu-monitor"})
+    try:
+        with urlopen(req, timeout=20) as r:
+            return load_json(r.read())["sha"]
+    except Exception as e:
+        print(f"[WARN] Could not read master HEAD commit: {e}")
+        return None
 
-    if local_hash == remote_hash and list(CACHE_DIR.rglob("*.json")):
-        print("[CACHE] Up to date (SHA256 match).")
-        return
 
-    print("[CACHE] Updating cache (ZIP changed)...")
-    for f in CACHE_DIR.glob("**/*.json"):
-        f.unlink()
-
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as z:
-        for name in z.namelist():
-            if name.endswith(".json") and FILAMENT_PATH in name:
+def ensure_cache():
+    """Refresh the profile cache if needed and return the cached JSON files."""
+    print("[INFO] Checking BambuStudio master HEAD commit...")
+
+    local_version = VERSION_FILE.read_text().strip() if VERSION_FILE.exists() else None
+    # One walk of the cache serves the freshness check, the cleanup and main()
+    cached = list(CACHE_DIR.rglob("*.json"))
+    has_cache = bool(cached)
+
+    # The commit SHA is a ~1 KB request; only download the archive when it moved
+    head_sha = fetch_head_sha()
+    if head_sha and head_sha == local_version and has_cache:
+        print("[CACHE] Up to date (HEAD commit match).")
+        return cached
+
+    # Spool the archive to disk so only the ZipFile's working set sits in memory
+    with tempfile.TemporaryFile() as zip_file:
+        with urlopen(ZIP_URL, timeout=60) as r:
+            remote_hash = download_with_sha256(r, zip_file)
+
+        # Without the API (e.g. rate limited) fall back to the archive's content hash
+        version = head_sha or remote_hash
+        if version == local_version and has_cache:
+            print("[CACHE] Up to date (SHA256 match).")
+            return cached
+
+        print("[CACHE] Updating cache (ZIP changed)...")
+        for f in cached:
+            f.unlink()
+
+        extracted = []
+        created_dirs = set()
+        with zipfile.ZipFile(zip_file) as z:
+            for name in z.namelist():
+                if not (name.endswith(".json") and FILAMENT_PATH in name):
+                    continue
                 rel = Path(name).relative_to(f"BambuStudio-master/{FILAMENT_PATH}")
                 target = CACHE_DIR / rel
-                target.parent.mkdir(parents=True, exist_ok=True)
-                with z.open(name) as src, open(target, "wb") as dst:
-                    shutil.copyfileobj(src, dst)
+                if target.parent not in created_dirs:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(target.parent)
+                # Profiles are small: one decompress and one write instead of a 16 KB copy loop
+                target.write_bytes(z.read(name))
+                extracted.append(target)
 
-    VERSION_FILE.write_text(remote_hash)
-    print(f"[CACHE] Extracted {len(list(CACHE_DIR.rglob('*.json')))} JSON files.")
+    VERSION_FILE.write_text(version)
+    print(f"[CACHE] Extracted {len(extracted)} JSON files.")
+    return extracted
 
 
 # ==================================================
 # MAIN BUILD
 # ==================================================
 def main():
-    ensure_cache()
+    files = ensure_cache()
 
     print("[INFO] Reading JSON profiles...")
-    files = list(CACHE_DIR.rglob("*.json"))
-    raw_profiles = {}
-    for f in files:
-        try:
-            data = json.loads(f.read_text("utf-8"))
-            name = data.get("name")
-            if name:
-                raw_profiles[name] = data
-        except Exception as e:
-            print(f"[WARN] Failed to load {f.name}: {e}")
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as ex:
+        results = list(ex.map(load_profile, files))
+    raw_profiles = dict(r for r in results if r and r[0])
 
     print(f"[INFO] Loaded {len(raw_profiles)} preset profiles.")
 
-    def resolve(name, visited=None):
-        if visited is None:
-            visited = set()
-        if name in visited:
-            return {}
-        visited.add(name)
+    resolved_cache = {}
+
+    def resolve(name):
+        # Shared base presets are resolved once; results are only read afterwards
+        cached = resolved_cache.get(name)
+        if cached is not None:
+            return cached
+        resolved_cache[name] = {}  # placeholder breaks inheritance cycles
         data = raw_profiles.get(name)
         if not data:
             return {}
 
         parent = data.get("inherits")
-        resolved = {}
-        if parent:
-            resolved.update(resolve(parent, visited))
-        resolved.update(data)
+        resolved = {**resolve(parent), **data} if parent else data
+        resolved_cache[name] = resolved
         return resolved
 
     output = {}
@@ -152,8 +222,7 @@ def main():
             continue
 
         alias = resolved.get("alias") or resolved.get("name")
-        setting_id = extract_setting_id(resolved)
-        nozzle_min, nozzle_max = extract_nozzle_range(resolved)
+        setting_id, nozzle_min, nozzle_max = profile_fields(resolved)
         filament_id = resolved.get("filament_id")
         filament_type = resolved.get("filament_type")
         compatible = resolved.get("compatible_printers", [])
@@ -178,8 +247,7 @@ def main():
 
     print(f"[INFO] Final alias groups: {len(output)}")
 
-    with open(OUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2)
+    write_json(OUT_FILE, output)
 
     print(
         f"[DONE] JSON written: {OUT_FILE} ({sum(len(v['variants']) for v in output.values())} variants)"
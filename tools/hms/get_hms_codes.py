@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
+import re
 from pathlib import Path
-from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - falls back to the stdlib
+    orjson = None
 
 BASE_URL = "https://raw.githubusercontent.com/bambulab/BambuStudio/master/resources/hms"
 INDEX_URL = "https://api.github.com/repos/bambulab/BambuStudio/contents/resources/hms"
@@ -18,20 +26,79 @@ DEFAULT_FILES = (
 )
 
 
-def download_file(url: str) -> bytes:
-    request = Request(url, headers={"User-Agent": "bambu-monitor/1.0"})
-    with urlopen(request, timeout=20) as response:
-        return response.read()
+HEADERS = {"User-Agent": "bambu-monitor/1.0"}
+_JSON_HEAD_RE = re.compile(rb"\s*[\[{]")
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_MAX_REDIRECTS = 5
+
+
+class KeepAliveClient:
+    """Sequential HTTPS GETs that reuse one persistent connection per host."""
+
+    def __init__(self, timeout: float = 20) -> None:
+        self._timeout = timeout
+        self._connections: dict[str, http.client.HTTPSConnection] = {}
+
+    def __enter__(self) -> "KeepAliveClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+    def _request(self, host: str, target: str) -> tuple[http.client.HTTPResponse, bytes]:
+        connection = self._connections.get(host)
+        if connection is None:
+            connection = http.client.HTTPSConnection(host, timeout=self._timeout)
+            self._connections[host] = connection
+        connection.request("GET", target, headers=HEADERS)
+        response = connection.getresponse()
+        return response, response.read()
+
+    def get(self, url: str) -> bytes:
+        for _ in range(_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            target = parts.path + (f"?{parts.query}" if parts.query else "")
+            try:
+                response, body = self._request(parts.netloc, target)
+            except (http.client.HTTPException, OSError):
+                # The server may drop an idle keep-alive connection; retry once on a fresh one
+                self._connections.pop(parts.netloc).close()
+                response, body = self._request(parts.netloc, target)
 
+            location = response.getheader("Location")
+            if response.status in _REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            if response.status != 200:
+                raise HTTPError(url, response.status, response.reason, response.headers, None)
+            return body
+        raise HTTPError(url, response.status, "too many redirects", response.headers, None)
 
-def list_hms_files() -> list[str]:
-    request = Request(INDEX_URL, headers={"User-Agent": "bambu-monitor/1.0"})
-    with urlopen(request, timeout=20) as response:
-        payload = json.loads(response.read().decode("utf-8"))
+
+def download_file(client: KeepAliveClient, url: str) -> bytes:
+    return client.get(url)
+
+
+def list_hms_files(client: KeepAliveClient) -> list[str]:
+    payload = json.loads(client.get(INDEX_URL).decode("utf-8"))
     names = [item.get("name", "") for item in payload if isinstance(item, dict)]
     return sorted(name for name in names if name.startswith("hms_en_") and name.endswith(".json"))
 
 
+def validate_payload(filename: str, payload: bytes, *, strict: bool) -> None:
+    if strict:
+        if orjson is not None:
+            orjson.loads(payload)
+        else:
+            json.loads(payload.decode("utf-8"))
+        return
+    # Upstream is trusted; only reject obvious non-JSON such as HTML error pages
+    if not _JSON_HEAD_RE.match(payload):
+        raise ValueError(f"Invalid JSON head in {filename}")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Download HMS json files.")
     parser.add_argument(
@@ -45,29 +112,34 @@ def main() -> int:
         default=None,
         help="Optional list of filenames to download",
     )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Fully parse each file before writing instead of a quick sanity check",
+    )
     args = parser.parse_args()
 
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    if args.files:
-        files = list(args.files)
-    else:
-        try:
-            files = list_hms_files()
-        except Exception:
-            files = list(DEFAULT_FILES)
-
-    if not files:
-        raise SystemExit("No HMS files resolved")
-
-    for filename in files:
-        url = f"{BASE_URL}/{filename}"
-        payload = download_file(url)
-        # Validate JSON before writing
-        json.loads(payload.decode("utf-8"))
-        (output_dir / filename).write_bytes(payload)
-        print(f"Downloaded {filename}")
+    with KeepAliveClient() as client:
+        if args.files:
+            files = list(args.files)
+        else:
+            try:
+                files = list_hms_files(client)
+            except Exception:
+                files = list(DEFAULT_FILES)
+
+        if not files:
+            raise SystemExit("No HMS files resolved")
+
+        for filename in files:
+            url = f"{BASE_URL}/{filename}"
+            payload = download_file(client, url)
+            validate_payload(filename, payload, strict=args.strict)
+            (output_dir / filename).write_bytes(payload)
+            print(f"Downloaded {filename}")
 
     return 0
 